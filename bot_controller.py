@@ -6,18 +6,20 @@ Main bot logic and trading automation controller
 import time
 import datetime
 import threading
+import traceback
 from typing import Optional, Dict, Any
 
 # Import all our modular components
-from logger_utils import logger
+from logger_utils import logger, is_enabled, DEBUG, cleanup_resources
 from config import DEFAULT_SYMBOLS
-from mt5_connection import check_mt5_status
+from mt5_connection import check_mt5_status, connect_mt5
 from data_manager import get_symbol_data, get_multiple_symbols_data
 from indicators import calculate_indicators
 from strategies import run_strategy
 from trading_operations import execute_trade_signal
 from session_management import check_trading_time, get_current_trading_session, adjust_strategy_for_session
-from risk_management import risk_management_check, check_daily_limits, increment_daily_trade_count, auto_recovery_check, check_order_limit
+from risk_management import (risk_management_check, check_daily_limits, increment_daily_trade_count, auto_recovery_check,
+                             check_order_limit, get_daily_trade_status, get_current_risk_metrics)
 from ai_analysis import ai_market_analysis
 from performance_tracking import send_hourly_report
 from validation_utils import validate_trading_conditions
@@ -30,6 +32,11 @@ is_running = False  # Renamed from bot_running to align with changes
 bot_thread: Optional[threading.Thread] = None # Explicitly typing bot_thread
 recovery_thread: Optional[threading.Thread] = None # Added for recovery monitor
 current_strategy = "Scalping"
+# Set to stop the trading loop; its waits block on this event so a stop takes effect immediately
+BOT_STOP = threading.Event()
+
+# Scans between the loop's generation-1 garbage collections
+CLEANUP_EVERY_SCANS = 20
 
 
 def main_trading_loop() -> None:
@@ -42,6 +49,7 @@ def main_trading_loop() -> None:
 
         # Reset daily counters
         check_daily_limits()
+        scan_count = 0
 
         # Main trading loop - FIXED stop mechanism
         while True:
@@ -57,16 +65,15 @@ def main_trading_loop() -> None:
 
                 # Check daily limits (now includes user-configurable daily order limit)
                 if not check_daily_limits():
-                    from risk_management import get_daily_trade_status
                     status = get_daily_trade_status()
                     logger(f"📊 Daily order limit reached ({status['current_count']}/{status['max_limit']}) - pausing for today")
-                    time.sleep(300)  # Wait 5 minutes then check again
+                    BOT_STOP.wait(300)  # Wait 5 minutes then check again (wakes at once on stop)
                     continue
 
                 # Check trading session
                 if not check_trading_time():
                     logger("⏰ Outside trading hours - waiting...")
-                    time.sleep(60)
+                    BOT_STOP.wait(60)
                     continue
 
                 # Get current strategy from GUI
@@ -87,15 +94,12 @@ def main_trading_loop() -> None:
                 # Check MT5 connection status
                 if not check_mt5_status():
                     logger("❌ MT5 connection lost, attempting recovery...")
-                    from mt5_connection import connect_mt5
                     if not connect_mt5():
                         logger("🔄 Waiting 30 seconds before retry...")
                         # Check stop signal during retry wait
-                        for wait_second in range(30):
-                            if not is_running: # Changed bot_running to is_running
-                                logger("🛑 Bot stopped during MT5 reconnection wait")
-                                return
-                            time.sleep(1)
+                        if BOT_STOP.wait(30):
+                            logger("🛑 Bot stopped during MT5 reconnection wait")
+                            return
                         continue
 
                 # Get trading symbols
@@ -109,14 +113,16 @@ def main_trading_loop() -> None:
                     logger(f"⚠️ GUI symbol retrieval issue: {str(gui_sym_e)}")
                     trading_symbols = DEFAULT_SYMBOLS[:3] # Fallback symbols
 
-                logger(f"📊 Analyzing {len(trading_symbols)} symbols with {current_strategy} strategy")
+                # Per-cycle status lines are DEBUG; the guard skips the f-string when they are filtered out
+                if is_enabled(DEBUG):
+                    logger(f"📊 Analyzing {len(trading_symbols)} symbols with {current_strategy} strategy", DEBUG)
 
                 # Get data for all symbols - FIXED parameter
                 symbol_data = get_multiple_symbols_data(trading_symbols, count=500)
 
                 if not symbol_data:
                     logger("❌ No symbol data available, waiting...")
-                    time.sleep(60)
+                    BOT_STOP.wait(60)
                     continue
 
                 # Process each symbol
@@ -151,7 +157,8 @@ def main_trading_loop() -> None:
                             # LIVE TRADING: More aggressive signal acceptance
                             signal_threshold = max(1, 1 + session_adjustments.get("signal_threshold_modifier", 0))
                             if len(signals) < signal_threshold:
-                                logger(f"⚪ {symbol}: Signal strength {len(signals)} below threshold {signal_threshold}")
+                                if is_enabled(DEBUG):
+                                    logger(f"⚪ {symbol}: Signal strength {len(signals)} below threshold {signal_threshold}", DEBUG)
                                 continue
 
                             try:
@@ -235,12 +242,17 @@ def main_trading_loop() -> None:
                 # Log summary
                 if signals_found > 0:
                     logger(f"📊 Scan complete: {signals_found} signals found from {len(symbol_data)} symbols")
-                else:
-                    logger(f"📊 Scan complete: No signals found from {len(symbol_data)} symbols")
+                elif is_enabled(DEBUG):
+                    logger(f"📊 Scan complete: No signals found from {len(symbol_data)} symbols", DEBUG)
 
                 # Auto-recovery check
                 auto_recovery_check()
 
+                # Periodic young-generation collect; the full gen-2 pass is left for shutdown
+                scan_count += 1
+                if scan_count % CLEANUP_EVERY_SCANS == 0:
+                    cleanup_resources()
+
                 # Send hourly report
                 current_time = datetime.datetime.now()
                 if current_time.minute == 0:  # Top of the hour
@@ -259,12 +271,11 @@ def main_trading_loop() -> None:
                     pass
 
                 # CRITICAL: Interruptible wait - check stop signal during wait
-                logger(f"⏳ Waiting {scan_interval} seconds before next scan...")
-                for wait_second in range(scan_interval):
-                    if not is_running: # Changed bot_running to is_running
-                        logger("🛑 Bot stopped during scan interval wait")
-                        return
-                    time.sleep(1)
+                if is_enabled(DEBUG):
+                    logger(f"⏳ Waiting {scan_interval} seconds before next scan...", DEBUG)
+                if BOT_STOP.wait(scan_interval):
+                    logger("🛑 Bot stopped during scan interval wait")
+                    return
 
             except KeyboardInterrupt:
                 logger("⚠️ Bot interrupted by user")
@@ -272,13 +283,11 @@ def main_trading_loop() -> None:
 
             except Exception as cycle_e:
                 logger(f"❌ Error in trading cycle: {str(cycle_e)}")
-                import traceback
                 logger(f"📝 Traceback: {traceback.format_exc()}")
-                time.sleep(60)  # Wait 1 minute before retry
+                BOT_STOP.wait(60)  # Wait 1 minute before retry
 
     except Exception as e:
         logger(f"❌ Critical error in bot thread: {str(e)}")
-        import traceback
         logger(f"📝 Critical traceback: {traceback.format_exc()}")
 
     finally:
@@ -311,6 +320,7 @@ def start_bot_thread() -> bool:
             return False
 
         logger("🚀 Starting trading bot thread...")
+        BOT_STOP.clear()
         is_running = True
 
         # Create and start thread
@@ -345,7 +355,6 @@ def safe_trading_loop():
         logger("⚠️ Trading loop interrupted by user")
     except Exception as e:
         logger(f"❌ Critical error in trading loop: {str(e)}")
-        import traceback
         logger(f"📝 Traceback: {traceback.format_exc()}")
 
         # Attempt recovery
@@ -427,8 +436,6 @@ def start_auto_recovery_monitor():
 def get_bot_status() -> Dict[str, Any]:
     """Get current bot status information"""
     try:
-        from risk_management import get_current_risk_metrics
-
         risk_metrics = get_current_risk_metrics()
 
         status = {
@@ -452,12 +459,19 @@ def get_bot_status() -> Dict[str, Any]:
         }
 
 
+def request_stop() -> None:
+    """Signal the trading loop to stop without waiting for the bot thread"""
+    global is_running
+    is_running = False
+    BOT_STOP.set()
+
+
 def stop_bot():
     """Stop the trading bot gracefully"""
-    global is_running, bot_thread
+    global bot_thread
     try:
         logger("🛑 Stopping trading bot...")
-        is_running = False
+        request_stop()
 
         # Wait for bot thread to finish
         if bot_thread and bot_thread.is_alive():
@@ -471,12 +485,11 @@ def stop_bot():
 
 def emergency_stop_all():
     """Emergency stop all operations"""
-    global is_running # Changed bot_running to is_running
     try:
         logger("🚨 EMERGENCY STOP INITIATED!")
 
         # Stop bot
-        is_running = False
+        request_stop()
 
         # Close all positions
         # Assuming emergency_cleanup already handles this, but can be called explicitly if needed
@@ -577,16 +590,15 @@ def trading_loop():
 
                 # Check daily limits (now includes user-configurable daily order limit)
                 if not check_daily_limits():
-                    from risk_management import get_daily_trade_status
                     status = get_daily_trade_status()
                     logger(f"📊 Daily order limit reached ({status['current_count']}/{status['max_limit']}) - pausing for today")
-                    time.sleep(300)  # Wait 5 minutes then check again
+                    BOT_STOP.wait(300)  # Wait 5 minutes then check again (wakes at once on stop)
                     continue
 
                 # Check trading session
                 if not check_trading_time():
                     logger("⏰ Outside trading hours - waiting...")
-                    time.sleep(60)
+                    BOT_STOP.wait(60)
                     continue
 
                 # Get current strategy from GUI
@@ -604,14 +616,11 @@ def trading_loop():
                 # Check MT5 connection status
                 if not check_mt5_status():
                     logger("❌ MT5 connection lost, attempting recovery...")
-                    from mt5_connection import connect_mt5
                     if not connect_mt5():
                         logger("🔄 Waiting 30 seconds before retry...")
-                        for wait_second in range(30):
-                            if not is_running:
-                                logger("🛑 Bot stopped during MT5 reconnection wait")
-                                return
-                            time.sleep(1)
+                        if BOT_STOP.wait(30):
+                            logger("🛑 Bot stopped during MT5 reconnection wait")
+                            return
                         continue
 
                 # Get trading symbols
@@ -625,13 +634,15 @@ def trading_loop():
                     logger(f"⚠️ GUI symbol retrieval issue: {str(gui_sym_e)}")
                     trading_symbols = DEFAULT_SYMBOLS[:3]
 
-                logger(f"📊 Analyzing {len(trading_symbols)} symbols with {current_strategy} strategy")
+                # Per-cycle status lines are DEBUG; the guard skips the f-string when they are filtered out
+                if is_enabled(DEBUG):
+                    logger(f"📊 Analyzing {len(trading_symbols)} symbols with {current_strategy} strategy", DEBUG)
 
                 symbol_data = get_multiple_symbols_data(trading_symbols, count=500)
 
                 if not symbol_data:
                     logger("❌ No symbol data available, waiting...")
-                    time.sleep(60)
+                    BOT_STOP.wait(60)
                     continue
 
                 signals_found = 0
@@ -658,7 +669,8 @@ def trading_loop():
 
                             signal_threshold = 1 + session_adjustments.get("signal_threshold_modifier", 0)
                             if len(signals) < signal_threshold:
-                                logger(f"⚪ {symbol}: Signal strength {len(signals)} below threshold {signal_threshold}")
+                                if is_enabled(DEBUG):
+                                    logger(f"⚪ {symbol}: Signal strength {len(signals)} below threshold {signal_threshold}", DEBUG)
                                 continue
 
                             try:
@@ -737,8 +749,8 @@ def trading_loop():
 
                 if signals_found > 0:
                     logger(f"📊 Scan complete: {signals_found} signals found from {len(symbol_data)} symbols")
-                else:
-                    logger(f"📊 Scan complete: No signals found from {len(symbol_data)} symbols")
+                elif is_enabled(DEBUG):
+                    logger(f"📊 Scan complete: No signals found from {len(symbol_data)} symbols", DEBUG)
 
                 auto_recovery_check()
 
@@ -757,12 +769,11 @@ def trading_loop():
                     logger(f"⚠️ GUI interval retrieval issue: {str(gui_interval_e)}")
                     pass
 
-                logger(f"⏳ Waiting {scan_interval} seconds before next scan...")
-                for wait_second in range(scan_interval):
-                    if not is_running:
-                        logger("🛑 Bot stopped during scan interval wait")
-                        return
-                    time.sleep(1)
+                if is_enabled(DEBUG):
+                    logger(f"⏳ Waiting {scan_interval} seconds before next scan...", DEBUG)
+                if BOT_STOP.wait(scan_interval):
+                    logger("🛑 Bot stopped during scan interval wait")
+                    return
 
             except KeyboardInterrupt:
                 logger("⚠️ Bot interrupted by user")
@@ -770,13 +781,11 @@ def trading_loop():
 
             except Exception as cycle_e:
                 logger(f"❌ Error in trading cycle: {str(cycle_e)}")
-                import traceback
                 logger(f"📝 Traceback: {traceback.format_exc()}")
-                time.sleep(60)
+                BOT_STOP.wait(60)
 
     except Exception as e:
         logger(f"❌ Critical error in bot thread: {str(e)}")
-        import traceback
         logger(f"📝 Critical traceback: {traceback.format_exc()}")
     finally:
         is_running = False
@@ -4,7 +4,7 @@ Configuration constants and settings for the trading bot
 """
 
 # Trading Strategies
-STRATEGIES = ["Scalping", "Intraday", "Arbitrage", "HFT"]
+STRATEGIES = ("Scalping", "Intraday", "Arbitrage", "HFT")
 
 # Default Trading Parameters with Enhanced Options
 DEFAULT_PARAMS = {
@@ -53,7 +53,7 @@ DEFAULT_PARAMS = {
 }
 
 # TP/SL Unit Options - Enhanced with percentage support
-TP_SL_UNITS = ["pips", "price", "percent", "balance%", "equity%", "money"]
+TP_SL_UNITS = ("pips", "price", "percent", "balance%", "equity%", "money")
 
 # Balance percentage settings
 BALANCE_PERCENTAGE_SETTINGS = {
@@ -64,7 +64,7 @@ BALANCE_PERCENTAGE_SETTINGS = {
 }
 
 # GUI Settings
-GUI_UPDATE_INTERVAL = 1500  # milliseconds
+GUI_UPDATE_INTERVAL = 1000  # milliseconds
 
 # Risk Management
 MAX_RISK_PERCENTAGE = 2.0
@@ -1,15 +1,35 @@
 
 import json
 import os
+import threading
 from typing import Dict, Any, Optional
 from logger_utils import logger
 
 class ConfigManager:
     """Robust configuration management with validation"""
+
+    # (key, minimum, maximum) - one table drives validation and auto-save
+    _NUMERIC_LIMITS = (
+        ("max_orders", 1, 100),
+        ("max_daily_trades", 1, 1000),
+        ("max_daily_orders", 1, 1000),
+        ("max_risk_percentage", 0.1, 10),
+        ("default_lot_size", 0.01, 100),
+    )
+    _AUTOSAVE_KEYS = frozenset(("max_orders", "max_daily_trades", "max_daily_orders", "max_risk_percentage"))
     
     def __init__(self, config_file: str = "bot_config.json"):
         self.config_file = config_file
         self.config = {}
+        self._save_lock = threading.Lock()
+        # Guards self.config against setters while a save serializes it
+        self._config_lock = threading.RLock()
+        # Background saves: one writer thread at a time, later requests coalesce into its next pass
+        self._writer_lock = threading.Lock()
+        self._writer = None
+        self._save_requested = False
+        self._last_saved_text = None
+        self._loaded_mtime = None
         self.default_config = {
             "max_orders": 10,
             "max_daily_trades": 50,
@@ -33,15 +53,23 @@ class ConfigManager:
         """Load configuration from file with fallback to defaults"""
         try:
             if os.path.exists(self.config_file):
+                # In-memory config already matches the file if it hasn't been touched since
+                mtime = os.path.getmtime(self.config_file)
+                if mtime == self._loaded_mtime:
+                    return True
+
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     loaded_config = json.load(f)
                 
                 # Validate and merge with defaults
-                self.config = self.default_config.copy()
-                self.config.update(loaded_config)
-                
-                # Validate critical values
-                self._validate_config()
+                config = self.default_config.copy()
+                config.update(loaded_config)
+                with self._config_lock:
+                    self.config = config
+                    
+                    # Validate critical values
+                    self._validate_config()
+                self._loaded_mtime = mtime
                 
                 logger(f"✅ Configuration loaded from {self.config_file}")
                 return True
@@ -61,13 +89,46 @@ class ConfigManager:
     def save_config(self) -> bool:
         """Save current configuration to file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            # Serialize writers and snapshot under the lock so the newest settings always land last
+            with self._save_lock:
+                with self._config_lock:
+                    text = json.dumps(self.config, indent=4, ensure_ascii=False)
+                if text == self._last_saved_text and os.path.exists(self.config_file):
+                    return True
+
+                # Write a temp file and swap it in, so an interrupted save never leaves a truncated config
+                temp_file = f"{self.config_file}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.config_file)
+                self._last_saved_text = text
+                self._loaded_mtime = os.path.getmtime(self.config_file)
             logger(f"💾 Configuration saved to {self.config_file}")
             return True
         except Exception as e:
             logger(f"❌ Error saving config: {str(e)}")
             return False
+
+    def save_config_async(self) -> None:
+        """Save current configuration on a background thread so callers on the GUI thread don't block on disk"""
+        with self._writer_lock:
+            self._save_requested = True
+            if self._writer is None:
+                # Not a daemon: interpreter exit waits for a save in progress to finish
+                self._writer = threading.Thread(target=self._save_worker, name="ConfigSave")
+                self._writer.start()
+
+    def _save_worker(self) -> None:
+        """Save until no further request arrived during the last write"""
+        while True:
+            with self._writer_lock:
+                if not self._save_requested:
+                    self._writer = None
+                    return
+                self._save_requested = False
+            self.save_config()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value with fallback"""
@@ -76,21 +137,22 @@ class ConfigManager:
     def set(self, key: str, value: Any) -> bool:
         """Set configuration value with validation"""
         try:
-            old_value = self.config.get(key)
-            self.config[key] = value
-            
-            # Validate after setting
-            if not self._validate_config():
-                # Revert if validation fails
-                if old_value is not None:
-                    self.config[key] = old_value
-                else:
-                    del self.config[key]
-                return False
+            with self._config_lock:
+                old_value = self.config.get(key)
+                self.config[key] = value
+                
+                # Validate after setting
+                if not self._validate_config():
+                    # Revert if validation fails
+                    if old_value is not None:
+                        self.config[key] = old_value
+                    else:
+                        del self.config[key]
+                    return False
             
             # Auto-save if critical setting
-            if key in ["max_orders", "max_daily_trades", "max_daily_orders", "max_risk_percentage"]:
-                self.save_config()
+            if key in self._AUTOSAVE_KEYS:
+                self.save_config_async()
             
             return True
             
@@ -102,25 +164,11 @@ class ConfigManager:
         """Validate configuration values"""
         try:
             # Validate numeric ranges
-            if self.config.get("max_orders", 0) < 1 or self.config.get("max_orders", 0) > 100:
-                logger("❌ Invalid max_orders: must be 1-100")
-                return False
-            
-            if self.config.get("max_daily_trades", 0) < 1 or self.config.get("max_daily_trades", 0) > 1000:
-                logger("❌ Invalid max_daily_trades: must be 1-1000")
-                return False
-            
-            if self.config.get("max_daily_orders", 0) < 1 or self.config.get("max_daily_orders", 0) > 1000:
-                logger("❌ Invalid max_daily_orders: must be 1-1000")
-                return False
-            
-            if self.config.get("max_risk_percentage", 0) < 0.1 or self.config.get("max_risk_percentage", 0) > 10:
-                logger("❌ Invalid max_risk_percentage: must be 0.1-10")
-                return False
-            
-            if self.config.get("default_lot_size", 0) < 0.01 or self.config.get("default_lot_size", 0) > 100:
-                logger("❌ Invalid default_lot_size: must be 0.01-100")
-                return False
+            config = self.config
+            for key, min_val, max_val in self._NUMERIC_LIMITS:
+                if not min_val <= config.get(key, 0) <= max_val:
+                    logger(f"❌ Invalid {key}: must be {min_val}-{max_val}")
+                    return False
             
             return True
             
@@ -131,7 +179,8 @@ class ConfigManager:
     def reset_to_defaults(self) -> bool:
         """Reset configuration to defaults"""
         try:
-            self.config = self.default_config.copy()
+            with self._config_lock:
+                self.config = self.default_config.copy()
             return self.save_config()
         except Exception as e:
             logger(f"❌ Error resetting config: {str(e)}")
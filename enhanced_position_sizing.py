@@ -170,21 +170,17 @@ class DynamicPositionSizer:
             else:  # Very small account
                 risk_percent = 3.0
 
-            # Calculate position size
-            risk_amount = equity * (risk_percent / 100)
+            # Calculate position size: risk amount / (pips at risk * pip value), folded into one division
             price_difference = abs(entry_price - stop_loss)
 
             # Get pip value for the symbol
             pip_value = self._get_pip_value(symbol_info, equity)
 
             if pip_value > 0 and price_difference > 0:
-                pips_at_risk = price_difference / symbol_info.point
-                lot_size = risk_amount / (pips_at_risk * pip_value)
-            else:
-                # Fallback calculation
-                lot_size = risk_amount / price_difference
+                return equity * risk_percent * symbol_info.point / (100.0 * price_difference * pip_value)
 
-            return lot_size
+            # Fallback calculation
+            return equity * risk_percent / (100.0 * price_difference)
 
         except Exception as e:
             logger(f"❌ Equity risk calculation error: {str(e)}")
@@ -295,10 +291,8 @@ class DynamicPositionSizer:
             # Apply min/max constraints
             size = max(min_volume, min(size, max_volume))
 
-            # Additional safety limits
-            size = max(self.min_lot_size, min(size, self.max_lot_size))
-
-            return size
+            # Additional safety limits; applied last so the user's lot cap always wins
+            return max(self.min_lot_size, min(size, self.max_lot_size))
 
         except Exception as e:
             logger(f"❌ Symbol limits error: {str(e)}")
@@ -388,26 +382,18 @@ def get_dynamic_position_size(symbol: str, strategy: str, base_lot_size: float)
 
         # Base volatility calculation using ATR-like method
         rates = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M5, 0, 20)
-        if not rates or len(rates) < 10:
+        if rates is None or len(rates) < 10:
             return base_lot_size
 
-        # Calculate average true range with proper type handling
-        highs = [float(r['high']) for r in rates]
-        lows = [float(r['low']) for r in rates]
-        closes = [float(r['close']) for r in rates]
-
-        true_ranges = []
-        for i in range(1, len(rates)):
-            tr1 = highs[i] - lows[i]
-            tr2 = abs(highs[i] - closes[i-1])
-            tr3 = abs(lows[i] - closes[i-1])
-            true_ranges.append(max(tr1, tr2, tr3))
-
-        if true_ranges:
-            avg_true_range = sum(true_ranges) / len(true_ranges)
-            atr_pips = avg_true_range / (point * 10) if point > 0 else 5.0
-        else:
-            atr_pips = 5.0
+        # Average true range over all bars at once (works for MT5 record arrays and mock dict lists)
+        bars = pd.DataFrame(rates)
+        highs = bars['high'].to_numpy(dtype=float)[1:]
+        lows = bars['low'].to_numpy(dtype=float)[1:]
+        prev_closes = bars['close'].to_numpy(dtype=float)[:-1]
+        true_ranges = np.maximum(highs - lows, np.maximum(np.abs(highs - prev_closes), np.abs(lows - prev_closes)))
+
+        avg_true_range = float(true_ranges.mean())
+        atr_pips = avg_true_range / (point * 10) if point > 0 else 5.0
 
         # Dynamic sizing factors
         volatility_factor = 1.0
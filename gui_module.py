@@ -4,21 +4,197 @@ Main GUI interface for the trading bot - identical to original but modular
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
+import __main__
 import datetime
+import platform
+import re
+import sys
 import threading
+import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
 # Import our modular components
-from logger_utils import logger
-from config import STRATEGIES, DEFAULT_PARAMS, GUI_UPDATE_INTERVAL
+from logger_utils import logger, is_enabled, DEBUG
+from config import STRATEGIES, TP_SL_UNITS, DEFAULT_PARAMS, GUI_UPDATE_INTERVAL, DEFAULT_SYMBOLS
 from mt5_connection import connect_mt5, get_account_info, get_positions, get_symbol_suggestions
-from validation_utils import validate_numeric_input
-from risk_management import get_current_risk_metrics
+import risk_management
+from risk_management import (set_max_orders_limit, reset_order_count,
+                             get_order_limit_status, get_daily_order_limit_status)
 from performance_tracking import generate_performance_report
-from telegram_notifications import notify_bot_status, notify_strategy_change, notify_balance_update, test_telegram_connection
+from telegram_notifications import notify_bot_status, notify_strategy_change, test_telegram_connection
+from data_manager import get_symbol_data
+import trading_operations
+import bot_controller
+
+try:
+    import MetaTrader5 as mt5
+except ImportError:
+    import mt5_mock as mt5
+
+# Log display limits: once over MAX_LOG_LINES, trim back down by LOG_TRIM_LINES in one delete
+MAX_LOG_LINES = 1000
+LOG_TRIM_LINES = 200
+# Most buffered lines written per flush tick, so a log burst can't stall the Tk thread
+LOG_FLUSH_BATCH = 500
+
+# Longest delay between GUI updates while update errors keep occurring (ms)
+GUI_MAX_BACKOFF = 60000
+# Poll interval while the window is minimized or withdrawn and updates are skipped (ms)
+GUI_HIDDEN_INTERVAL = GUI_UPDATE_INTERVAL * 4
+# Updates start every GUI_UPDATE_INTERVAL: the wait shrinks by the mean time of the last
+# GUI_TIMING_SAMPLES updates, but never below GUI_MIN_DELAY so the window stays responsive (ms)
+GUI_TIMING_SAMPLES = 10
+GUI_MIN_DELAY = 100
+# Least time between full GUI update tracebacks while errors repeat; in between only the message is logged (s)
+GUI_TRACEBACK_INTERVAL = 5.0
+
+# Quiet period after the last keystroke before a typed symbol is validated against MT5 (ms)
+SYMBOL_INPUT_DEBOUNCE = 300
+
+# Numeric parameter fields: (default, minimum, maximum); out-of-range input falls back to the default
+LOT_LIMITS = (0.01, 0.01, 100.0)
+TP_LIMITS = (20.0, 0.0, 1000.0)
+SL_LIMITS = (10.0, 0.0, 1000.0)
+INTERVAL_LIMITS = (10, 1, 3600)
+
+# Settings handed out when the parameter widgets can't be read (read-only; callers get a copy)
+DEFAULT_SETTINGS = MappingProxyType({
+    'strategy': "Scalping",
+    'symbol': "EURUSD",
+    'lot_size': LOT_LIMITS[0],
+    'tp': TP_LIMITS[0],
+    'sl': SL_LIMITS[0],
+    'tp_unit': "pips",
+    'sl_unit': "pips",
+    'interval': INTERVAL_LIMITS[0],
+})
+
+# Strategy names as shown in the log, and the parameters used for unknown strategies
+STRATEGY_DISPLAY_NAMES = {
+    "Scalping": "📈 SCALPING Strategy",
+    "Intraday": "⏰ INTRADAY Strategy",
+    "Arbitrage": "⚖️ ARBITRAGE Strategy",
+    "HFT": "⚡ HIGH FREQUENCY TRADING (HFT) Strategy"
+}
+_FALLBACK_PARAMS = DEFAULT_PARAMS["Scalping"]
+
+# Multi-line log message templates, filled with str.format
+BOT_CONFIG_TEMPLATE = (
+    "⚙️ Bot Configuration:\n"
+    "   Strategy: {strategy}\n"
+    "   Symbol: {symbol}\n"
+    "   Lot Size: {lot_size}\n"
+    "   TP: {tp} {tp_unit}\n"
+    "   SL: {sl} {sl_unit}"
+)
+
+STRATEGY_PARAMS_TEMPLATE = (
+    "📊 {display_name} Parameters Updated:\n"
+    "   💰 Lot Size: {lot_size}\n"
+    "   🎯 Take Profit: {tp} {tp_unit}\n"
+    "   🛡️ Stop Loss: {sl} {sl_unit}\n"
+    "   📊 Signal Threshold: {signal_threshold}\n"
+    "   📏 Spread Range: {min_spread} - {max_spread} pips"
+)
+
+# Checklist logged as one entry when auto-connection to MT5 fails
+TROUBLESHOOT_TEMPLATE = (
+    "🔧 TROUBLESHOOTING WAJIB:\n"
+    "   1. 🔴 TUTUP MT5 SEPENUHNYA\n"
+    "   2. 🔴 KLIK KANAN MT5 → 'Run as Administrator'\n"
+    "   3. 🔴 LOGIN ke akun trading dengan kredensial yang benar\n"
+    "   4. 🔴 PASTIKAN status 'Connected' muncul di MT5\n"
+    "   5. 🔴 BUKA Market Watch dan tambahkan symbols (EURUSD, dll)\n"
+    "   6. 🔴 PASTIKAN Python dan MT5 sama-sama 64-bit\n"
+    "   7. 🔴 DISABLE antivirus sementara jika perlu\n"
+    "   8. 🔴 RESTART komputer jika masalah persisten"
+)
+
+# Account labels: (label attribute, caption, text shown before the first update)
+ACCOUNT_LABELS = (
+    ("balance_lbl", "Balance", "Balance: $0.00"),
+    ("equity_lbl", "Equity", "Equity: $0.00"),
+    ("margin_lbl", "Free Margin", "Free Margin: $0.00"),
+    ("margin_level_lbl", "Margin Level", "Margin Level: 0%"),
+    ("server_lbl", "Server", "Server: Not Connected"),
+)
+
+# Account labels filled from the account info dict with str.format_map: (label attribute, template)
+ACCOUNT_LABEL_TEMPLATES = (
+    ("balance_lbl", "Balance: ${balance:.2f}"),
+    ("equity_lbl", "Equity: ${equity:.2f}"),
+    ("margin_lbl", "Free Margin: ${free_margin:.2f}"),
+    ("server_lbl", "Server: {server}"),
+)
+
+
+# Symbol dropdown categories in display order: (tokens matched in the upper-cased name, max name length)
+SYMBOL_CATEGORIES = (
+    (('EUR', 'GBP', 'USD', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD'), 7),  # Forex
+    (('XAU', 'XAG', 'GOLD', 'SILVER'), None),  # Metals
+    (('BTC', 'ETH', 'LTC', 'XRP'), None),  # Crypto
+    (('OIL', 'NGAS', 'WHEAT'), None),  # Commodities
+    (('US30', 'US500', 'NAS100', 'GER30', 'UK100', 'JPN225'), None),  # Indices
+)
+_SYMBOL_TOKEN_CATEGORY = {token: index for index, (tokens, _) in enumerate(SYMBOL_CATEGORIES) for token in tokens}
+# Longest tokens first so e.g. US500 wins over USD at the same position
+_SYMBOL_TOKEN_RE = re.compile("|".join(map(re.escape, sorted(_SYMBOL_TOKEN_CATEGORY, key=len, reverse=True))))
+
+
+@lru_cache(maxsize=8)
+def _organize_symbols(symbols: tuple) -> tuple:
+    """Group symbols by SYMBOL_CATEGORIES; returns (ordered symbols, count per category)
+
+    Each symbol is scanned once and filed under the category of its leftmost token,
+    so XAUUSD is a metal and BTCUSD a crypto rather than also being listed as forex.
+    symbols must already be sorted; buckets keep that order, so none is sorted again.
+    """
+    buckets = tuple([] for _ in SYMBOL_CATEGORIES)
+    for symbol in symbols:
+        match = _SYMBOL_TOKEN_RE.search(symbol.upper())
+        if match is None:
+            continue
+        index = _SYMBOL_TOKEN_CATEGORY[match.group(0)]
+        max_len = SYMBOL_CATEGORIES[index][1]
+        if max_len is None or len(symbol) <= max_len:
+            buckets[index].append(symbol)
+
+    organized = tuple(symbol for bucket in buckets for symbol in bucket)
+    return organized, tuple(len(bucket) for bucket in buckets)
+
+
+def _is_decimal_text(text: str) -> bool:
+    """Entry validatecommand: accept a decimal number or a partial one still being typed"""
+    if text in ("", "-", ".", "-."):
+        return True
+    if not all(c in "0123456789.-" for c in text):
+        return False
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_integer_text(text: str) -> bool:
+    """Entry validatecommand: accept only digits (or an empty field)"""
+    return text == "" or text.isdigit()
+
+
+def _read_number(get, default: float, min_val: float, max_val: float) -> float:
+    """Read a DoubleVar/IntVar field through its bound get; empty, invalid or out-of-range input gives default"""
+    try:
+        value = get()
+    except (tk.TclError, ValueError):
+        return default
+    return value if min_val <= value <= max_val else default
 
 
 class TradingBotGUI:
@@ -33,15 +209,65 @@ class TradingBotGUI:
         self.root.columnconfigure(0, weight=1)
 
         self.current_strategy = "Scalping"
+        # Strategy reported as "old" in the next strategy-change notification
+        self._previous_strategy = None
         self._update_counter = 0
-        self._last_update_time = datetime.datetime.now()
+        # Durations (s) of the most recent GUI updates, from collection start to applied
+        self._update_durations = deque(maxlen=GUI_TIMING_SAMPLES)
+        # perf_counter() when the in-flight GUI update started collecting data
+        self._update_start = 0.0
+        # (epoch second, "HH:MM:SS") so log lines within the same second reuse one formatted stamp
+        self._log_stamp = (0, "")
         self._shutdown_in_progress = False
 
+        # Cleared on shutdown; recurring after() loops stop rescheduling
+        self._alive = threading.Event()
+        self._alive.set()
+        self._gui_update_after_id = None
+        self._log_flush_after_id = None
+        self._symbol_input_after_id = None
+        self._gui_update_delay = GUI_UPDATE_INTERVAL
+        # time.monotonic() of the last logged GUI update traceback
+        self._last_traceback_at = 0.0
+
+        # Last applied option values per widget, to skip no-op configure calls
+        self._widget_state = {}
+
+        # Performance report popup, built on first use
+        self._report_text = None
+
+        # Values currently shown per position row, keyed by ticket (Treeview iid)
+        self._position_rows = {}
+        # Raw account / position fields behind the last displayed update, to skip unchanged ticks
+        self._last_account = None
+        self._last_positions = None
+
+        # Buffered log lines, flushed to the log display in batches.
+        # log() may be called from worker threads, so it only appends here;
+        # all widget access happens in _flush_logs on the Tk main thread.
+        # Capped at MAX_LOG_LINES: older pending lines would be trimmed from the display anyway.
+        self._log_buf = deque(maxlen=MAX_LOG_LINES)
+        # Line number of the log widget's last line (an empty Text widget is on line 1)
+        self._log_line_count = 1
+
+        # Shared worker pool for blocking MT5/network calls made by handlers
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mt5io")
+
         # Initialize order count
         self.order_count = 0
 
+        # MT5 connection as last reported to the GUI; decides whether the close button is usable
+        self._mt5_connected = False
+        # Set while a close-all request runs on the worker pool
+        self._closing_positions = False
+
+        # Memoized snapshot of the trading parameter fields
+        self._settings_cache = None
+        self._settings_dirty = True
+
         # Create widgets
         self.create_widgets()
+        self._setup_settings_tracking()
 
         # Initialize GUI states
         self.start_btn.config(state="disabled")
@@ -52,17 +278,30 @@ class TradingBotGUI:
         # Auto-connect on startup
         self.root.after(1000, self.auto_connect_mt5)
 
-        # Start GUI updates
-        self.root.after(2000, self.update_gui_data)
+        # Start GUI updates on the regular cadence, after the auto-connect attempt
+        self._gui_update_after_id = self.root.after(GUI_UPDATE_INTERVAL, self.update_gui_data)
 
-    def create_widgets(self):
-        """Enhanced GUI creation with better layout"""
+        # Start draining buffered log lines on the main thread
+        self._log_flush_after_id = self.root.after(50, self._flush_logs)
+
+    def _configure_styles(self):
+        """Set up every ttk style once, before any widget that uses them exists"""
         style = ttk.Style()
         style.theme_use("clam")
         style.configure("TFrame", background="#0f0f0f")
         style.configure("TLabel", background="#0f0f0f", foreground="white")
         style.configure("TButton", background="#2c5aa0", foreground="white")
-        style.configure("Treeview", background="#1a1a1a", foreground="white")
+        # Fixed-width font so numeric cells have a constant glyph advance
+        style.configure("Treeview", background="#1a1a1a", foreground="white", font=("Consolas", 9))
+        style.configure("Emergency.TButton", background="#d32f2f", foreground="white")
+
+    def create_widgets(self):
+        """Enhanced GUI creation with better layout"""
+        # Reject non-numeric keystrokes in numeric fields (%P = text after the edit)
+        decimal_vcmd = (self.root.register(_is_decimal_text), "%P")
+        integer_vcmd = (self.root.register(_is_integer_text), "%P")
+
+        self._configure_styles()
 
         # Main container
         main_frame = ttk.Frame(self.root)
@@ -102,9 +341,6 @@ class TradingBotGUI:
                                       command=self.emergency_stop, style="Emergency.TButton")
         self.emergency_btn.grid(row=0, column=3, padx=(0, 10))
 
-        # Configure emergency button style
-        style.configure("Emergency.TButton", background="#d32f2f", foreground="white")
-
         # Strategy and parameters frame - Enhanced layout
         params_frame = ttk.LabelFrame(top_frame, text="⚙️ Strategy & Parameters", padding="8")
         params_frame.grid(row=0, column=2, sticky="ew")
@@ -112,7 +348,9 @@ class TradingBotGUI:
 
         # Row 0: Strategy and Symbol
         ttk.Label(params_frame, text="Strategy:").grid(row=0, column=0, sticky="w", padx=(0,3))
-        self.strategy_combo = ttk.Combobox(params_frame, values=STRATEGIES, state="readonly", width=10)
+        self.strategy_var = tk.StringVar()
+        self.strategy_combo = ttk.Combobox(params_frame, values=STRATEGIES, state="readonly", width=10,
+                                           textvariable=self.strategy_var)
         self.strategy_combo.set("Scalping")
         self.strategy_combo.grid(row=0, column=1, padx=(0, 10), sticky="w")
         self.strategy_combo.bind("<<ComboboxSelected>>", self.on_strategy_change)
@@ -120,11 +358,6 @@ class TradingBotGUI:
         ttk.Label(params_frame, text="Symbol:").grid(row=0, column=2, sticky="w", padx=(0,3))
         # REAL MT5 Symbol Loading (FIXED)
         try:
-            try:
-                import MetaTrader5 as mt5
-            except ImportError:
-                import mt5_mock as mt5
-
             # Load REAL symbols from MT5
             symbols = mt5.symbols_get()
             if symbols and len(symbols) > 0:
@@ -145,7 +378,10 @@ class TradingBotGUI:
             self.log(f"❌ Symbol load error: {str(e)}")
 
         # Create editable symbol combo for manual input
-        self.symbol_combo = ttk.Combobox(params_frame, values=symbol_names, width=12)
+        self.symbol_var = tk.StringVar()
+        self.symbol_combo = ttk.Combobox(params_frame, values=symbol_names, width=12,
+                                         textvariable=self.symbol_var)
+        self._symbol_values = tuple(symbol_names)
         self.symbol_combo.set("EURUSD")  # Default
         self.symbol_combo.grid(row=0, column=3, padx=(0, 5), sticky="ew")
         self.symbol_combo.bind("<<ComboboxSelected>>", self.on_symbol_change)
@@ -153,8 +389,9 @@ class TradingBotGUI:
 
         # Row 1: Lot Size and SL (FIXED: Label was swapped)
         ttk.Label(params_frame, text="Lot:").grid(row=1, column=0, sticky="w", padx=(0,3))
-        self.lot_entry = ttk.Entry(params_frame, width=8)
-        self.lot_entry.insert(0, "0.01")
+        self.lot_var = tk.DoubleVar(value=0.01)
+        self.lot_entry = ttk.Entry(params_frame, width=8, textvariable=self.lot_var,
+                                   validate="key", validatecommand=decimal_vcmd)
         self.lot_entry.grid(row=1, column=1, padx=(0, 10), sticky="w")
 
         ttk.Label(params_frame, text="SL:").grid(row=1, column=2, sticky="w", padx=(0,3))
@@ -163,13 +400,14 @@ class TradingBotGUI:
         sl_frame = ttk.Frame(params_frame)
         sl_frame.grid(row=1, column=3, padx=(0, 5), sticky="w")
 
-        self.sl_entry = ttk.Entry(sl_frame, width=6)
-        self.sl_entry.insert(0, "10")
+        self.sl_var = tk.DoubleVar(value=10)
+        self.sl_entry = ttk.Entry(sl_frame, width=6, textvariable=self.sl_var,
+                                  validate="key", validatecommand=decimal_vcmd)
         self.sl_entry.grid(row=0, column=0, padx=(0, 2))
 
-        from config import TP_SL_UNITS
+        self.sl_unit_var = tk.StringVar()
         self.sl_unit_combo = ttk.Combobox(sl_frame, values=TP_SL_UNITS,
-                                         state="readonly", width=8)
+                                         state="readonly", width=8, textvariable=self.sl_unit_var)
         self.sl_unit_combo.set("pips")
         self.sl_unit_combo.grid(row=0, column=1)
         self.sl_unit_combo.bind("<<ComboboxSelected>>", self.on_sl_unit_change)
@@ -181,20 +419,23 @@ class TradingBotGUI:
         tp_frame = ttk.Frame(params_frame)
         tp_frame.grid(row=2, column=1, padx=(0, 10), sticky="w")
 
-        self.tp_entry = ttk.Entry(tp_frame, width=6)
-        self.tp_entry.insert(0, "20")
+        self.tp_var = tk.DoubleVar(value=20)
+        self.tp_entry = ttk.Entry(tp_frame, width=6, textvariable=self.tp_var,
+                                  validate="key", validatecommand=decimal_vcmd)
         self.tp_entry.grid(row=0, column=0, padx=(0, 2))
 
+        self.tp_unit_var = tk.StringVar()
         self.tp_unit_combo = ttk.Combobox(tp_frame, values=TP_SL_UNITS,
-                                         state="readonly", width=8)
+                                         state="readonly", width=8, textvariable=self.tp_unit_var)
         self.tp_unit_combo.set("pips")
         self.tp_unit_combo.grid(row=0, column=1)
         self.tp_unit_combo.bind("<<ComboboxSelected>>", self.on_tp_unit_change)
 
         # Scan Interval
         ttk.Label(params_frame, text="Scan Interval (sec):").grid(row=2, column=2, sticky="w", padx=(0,3))
-        self.interval_entry = ttk.Entry(params_frame, width=6)
-        self.interval_entry.insert(0, "10")  # Default 10 seconds instead of 30
+        self.interval_var = tk.IntVar(value=10)  # Default 10 seconds instead of 30
+        self.interval_entry = ttk.Entry(params_frame, width=6, textvariable=self.interval_var,
+                                        validate="key", validatecommand=integer_vcmd)
         self.interval_entry.grid(row=2, column=3, padx=(0, 5), sticky="w")
 
         # Row 3: Order Limit Controls (NEW)
@@ -204,7 +445,8 @@ class TradingBotGUI:
         order_limit_frame = ttk.Frame(params_frame)
         order_limit_frame.grid(row=3, column=1, padx=(0, 10), sticky="w")
 
-        self.max_orders_entry = ttk.Entry(order_limit_frame, width=4)
+        self.max_orders_entry = ttk.Entry(order_limit_frame, width=4,
+                                          validate="key", validatecommand=integer_vcmd)
         self.max_orders_entry.insert(0, "10")
         self.max_orders_entry.grid(row=0, column=0, padx=(0, 2))
 
@@ -232,19 +474,23 @@ class TradingBotGUI:
         account_frame = ttk.LabelFrame(left_frame, text="💰 Account Information", padding="10")
         account_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
 
-        self.balance_lbl = ttk.Label(account_frame, text="Balance: $0.00", font=("Arial", 10, "bold"))
+        # Account label text is driven through StringVars, see _show_account_label
+        self._account_vars = {attr: tk.StringVar(value=initial) for attr, _, initial in ACCOUNT_LABELS}
+
+        self.balance_lbl = ttk.Label(account_frame, textvariable=self._account_vars["balance_lbl"],
+                                     font=("Arial", 10, "bold"))
         self.balance_lbl.grid(row=0, column=0, sticky="w")
 
-        self.equity_lbl = ttk.Label(account_frame, text="Equity: $0.00")
+        self.equity_lbl = ttk.Label(account_frame, textvariable=self._account_vars["equity_lbl"])
         self.equity_lbl.grid(row=1, column=0, sticky="w")
 
-        self.margin_lbl = ttk.Label(account_frame, text="Free Margin: $0.00")
+        self.margin_lbl = ttk.Label(account_frame, textvariable=self._account_vars["margin_lbl"])
         self.margin_lbl.grid(row=2, column=0, sticky="w")
 
-        self.margin_level_lbl = ttk.Label(account_frame, text="Margin Level: 0%")
+        self.margin_level_lbl = ttk.Label(account_frame, textvariable=self._account_vars["margin_level_lbl"])
         self.margin_level_lbl.grid(row=3, column=0, sticky="w")
 
-        self.server_lbl = ttk.Label(account_frame, text="Server: Not Connected")
+        self.server_lbl = ttk.Label(account_frame, textvariable=self._account_vars["server_lbl"])
         self.server_lbl.grid(row=4, column=0, sticky="w")
 
         # Bot status
@@ -261,12 +507,11 @@ class TradingBotGUI:
         columns = ("Symbol", "Type", "Volume", "Price", "TP", "SL", "Current", "Profit")
         self.positions_tree = ttk.Treeview(positions_frame, columns=columns, show="headings", height=8)
 
+        # Fixed widths with stretch off, so inserting rows never re-lays out the columns
         for col in columns:
             self.positions_tree.heading(col, text=col)
-            if col in ["TP", "SL"]:
-                self.positions_tree.column(col, width=75, anchor="center")
-            else:
-                self.positions_tree.column(col, width=80, anchor="center")
+            width = 75 if col in ("TP", "SL") else 80
+            self.positions_tree.column(col, width=width, anchor="center", stretch=False)
 
         # Scrollbar for positions
         pos_scrollbar = ttk.Scrollbar(positions_frame, orient="vertical", command=self.positions_tree.yview)
@@ -288,11 +533,20 @@ class TradingBotGUI:
         log_frame.rowconfigure(0, weight=1)
         log_frame.columnconfigure(0, weight=1)
 
-        # Log text area
-        self.log_text = ScrolledText(log_frame, height=25, width=80,
-                                    bg="#1a1a1a", fg="white",
-                                    font=("Consolas", 9))
+        # Log text area - append-only, so no undo history
+        self.log_text = tk.Text(log_frame, height=25, width=80,
+                                bg="#1a1a1a", fg="white",
+                                font=("Consolas", 9), wrap=tk.WORD,
+                                undo=False, autoseparators=False, maxundo=0)
+        log_scrollbar = ttk.Scrollbar(log_frame, orient="vertical", command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+
         self.log_text.grid(row=0, column=0, sticky="nsew")
+        log_scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # Append point for new log lines; right gravity keeps it at the tail
+        self.log_text.mark_set("logtail", "end-1c")
+        self.log_text.mark_gravity("logtail", "right")
 
         # Action buttons frame
         actions_frame = ttk.LabelFrame(right_frame, text="🎮 Actions", padding="10")
@@ -322,77 +576,89 @@ class TradingBotGUI:
             print("🚀 Trading Bot GUI initialized successfully")
 
     def auto_connect_mt5(self):
-        """Enhanced auto-connection on startup with better error handling"""
+        """Enhanced auto-connection on startup; the blocking MT5/Telegram calls run on the worker pool"""
         try:
             self.log("🔄 Starting auto-connection to MetaTrader 5...")
             self.log("💡 PASTIKAN: MT5 sudah dijalankan dan login ke akun trading")
             self.log("💡 PENTING: MT5 harus dijalankan sebagai Administrator")
             self.status_lbl.config(text="Status: Connecting... 🔄", foreground="orange")
-            self.root.update()
 
             # Show system info first
-            import platform
-            import sys
             self.log(f"🔍 Python: {sys.version.split()[0]} ({platform.architecture()[0]})")
             self.log(f"🔍 Platform: {platform.system()} {platform.release()}")
 
-            if connect_mt5():
+            self.run_in_background(self._auto_connect_worker, self._on_auto_connect_done)
+
+        except Exception as e:
+            self._on_auto_connect_error(e)
+
+    def _auto_connect_worker(self):
+        """Connect, then fetch account details and test Telegram (worker thread, no widget access)"""
+        if not connect_mt5():
+            return False, None, None
+
+        info = None
+        telegram_ok = None
+        try:
+            info = get_account_info()
+            if info:
+                logger("📱 Testing Telegram connection...")
+                telegram_ok = test_telegram_connection()
+        except Exception as info_e:
+            logger(f"⚠️ Error getting account details: {str(info_e)}")
+        return True, info, telegram_ok
+
+    def _on_auto_connect_done(self, future):
+        """Apply the auto-connection result on the Tk main thread"""
+        try:
+            connected, info, telegram_ok = future.result()
+
+            if connected:
                 self.log("🎉 SUCCESS: Auto-connected to MetaTrader 5!")
                 self.status_lbl.config(text="Status: Connected ✅", foreground="green")
+                self._mt5_connected = True
                 self.update_symbols()
                 self.start_btn.config(state="normal")
-                self.close_btn.config(state="normal")
+                self._set_close_button_state()
                 self.connect_btn.config(state="disabled")
 
                 # Show detailed connection info
-                try:
-                    info = get_account_info()
-                    if info:
-                        self.log(f"👤 Account: {info.get('login', 'N/A')} | Server: {info.get('server', 'N/A')}")
-                        self.log(f"💰 Balance: ${info.get('balance', 0):.2f} | Equity: ${info.get('equity', 0):.2f}")
-                        self.log(f"🔐 Trade Permission: {'✅' if info.get('balance', 0) > 0 else '⚠️'}")
-
-                        self.log("🚀 GUI-MT5 connection established successfully!")
-                        self.log("🚀 Ready to start automated trading!")
-
-                        # Test Telegram notifications
-                        self.log("📱 Testing Telegram connection...")
-                        if test_telegram_connection():
-                            self.log("✅ Telegram notifications active")
-                        else:
-                            self.log("⚠️ Telegram notifications failed")
-                except Exception as info_e:
-                    self.log(f"⚠️ Error getting account details: {str(info_e)}")
+                if info:
+                    self.log(f"👤 Account: {info.get('login', 'N/A')} | Server: {info.get('server', 'N/A')}")
+                    self.log(f"💰 Balance: ${info.get('balance', 0):.2f} | Equity: ${info.get('equity', 0):.2f}")
+                    self.log(f"🔐 Trade Permission: {'✅' if info.get('balance', 0) > 0 else '⚠️'}")
+
+                    self.log("🚀 GUI-MT5 connection established successfully!")
+                    self.log("🚀 Ready to start automated trading!")
+
+                    # Telegram was tested alongside the connection
+                    if telegram_ok:
+                        self.log("✅ Telegram notifications active")
+                    else:
+                        self.log("⚠️ Telegram notifications failed")
             else:
                 self.log("❌ FAILED: Auto-connection to MT5 failed")
-                self.log("🔧 TROUBLESHOOTING WAJIB:")
-                self.log("   1. 🔴 TUTUP MT5 SEPENUHNYA")
-                self.log("   2. 🔴 KLIK KANAN MT5 → 'Run as Administrator'")
-                self.log("   3. 🔴 LOGIN ke akun trading dengan kredensial yang benar")
-                self.log("   4. 🔴 PASTIKAN status 'Connected' muncul di MT5")
-                self.log("   5. 🔴 BUKA Market Watch dan tambahkan symbols (EURUSD, dll)")
-                self.log("   6. 🔴 PASTIKAN Python dan MT5 sama-sama 64-bit")
-                self.log("   7. 🔴 DISABLE antivirus sementara jika perlu")
-                self.log("   8. 🔴 RESTART komputer jika masalah persisten")
+                self.log(TROUBLESHOOT_TEMPLATE)
 
                 self.status_lbl.config(text="Status: Connection Failed ❌", foreground="red")
 
                 # Enable manual connect button
+                self._mt5_connected = False
                 self.connect_btn.config(state="normal")
                 self.start_btn.config(state="disabled")
-                self.close_btn.config(state="disabled")
+                self._set_close_button_state()
 
                 # Show error in account labels
-                self.balance_lbl.config(text="Balance: N/A", foreground="gray")
-                self.equity_lbl.config(text="Equity: N/A", foreground="gray")
-                self.margin_lbl.config(text="Free Margin: N/A", foreground="gray")
-                self.margin_level_lbl.config(text="Margin Level: N/A", foreground="gray")
-                self.server_lbl.config(text="Server: N/A")
+                self._show_account_placeholder("N/A")
 
         except Exception as e:
-            error_msg = f"❌ CRITICAL: Auto-connection error: {str(e)}"
-            self.log(error_msg)
-            self.status_lbl.config(text="Status: Critical Error ❌", foreground="red")
+            self._on_auto_connect_error(e)
+
+    def _on_auto_connect_error(self, e: Exception):
+        """Show an auto-connection error"""
+        error_msg = f"❌ CRITICAL: Auto-connection error: {str(e)}"
+        self.log(error_msg)
+        self.status_lbl.config(text="Status: Critical Error ❌", foreground="red")
 
     def connect_mt5(self):
         """Enhanced MT5 connection with comprehensive GUI feedback and proper error handling"""
@@ -400,14 +666,23 @@ class TradingBotGUI:
             self.log("🔄 Manual MT5 connection initiated...")
             self.status_lbl.config(text="Status: Connecting... 🔄", foreground="orange")
             self.connect_btn.config(state="disabled", text="Connecting...")
-            self.root.update()
 
-            if connect_mt5():
+            # Connect on the worker pool so the window stays responsive
+            self.run_in_background(connect_mt5, self._on_connect_done)
+
+        except Exception as e:
+            self._on_connect_error(e)
+
+    def _on_connect_done(self, future):
+        """Apply the manual connection result on the Tk main thread"""
+        try:
+            if future.result():
                 self.log("✅ MT5 connection successful!")
                 self.status_lbl.config(text="Status: Connected ✅", foreground="green")
+                self._mt5_connected = True
                 self.connect_btn.config(text="Connected", state="disabled")
                 self.start_btn.config(state="normal")
-                self.close_btn.config(state="normal")
+                self._set_close_button_state()
 
                 # Update symbols and account info
                 self.update_symbols()
@@ -422,10 +697,38 @@ class TradingBotGUI:
                 self.connect_btn.config(text="Retry Connection", state="normal")
 
         except Exception as e:
-            error_msg = f"❌ Connection error: {str(e)}"
-            self.log(error_msg)
-            self.status_lbl.config(text="Status: Error ❌", foreground="red")
-            self.connect_btn.config(text="Retry Connection", state="normal")
+            self._on_connect_error(e)
+
+    def _on_connect_error(self, e: Exception):
+        """Show a connection error and allow the user to retry"""
+        error_msg = f"❌ Connection error: {str(e)}"
+        self.log(error_msg)
+        self.status_lbl.config(text="Status: Error ❌", foreground="red")
+        self.connect_btn.config(text="Retry Connection", state="normal")
+
+    def run_in_background(self, func, callback=None, *args):
+        """Run a blocking call on the worker pool; callback gets the future on the Tk thread"""
+        future = self._io_pool.submit(func, *args)
+        if callback is not None:
+            future.add_done_callback(lambda f: self._deliver_result(callback, f))
+        return future
+
+    def _deliver_result(self, callback, future):
+        """Marshal a finished background call back to the Tk thread unless shutting down"""
+        if self._alive.is_set():
+            try:
+                self.root.after(0, callback, future)
+            except (tk.TclError, RuntimeError):
+                pass
+
+    def _notify_in_background(self, what: str, func, *args):
+        """Send a Telegram notification on the worker pool; a failure is logged on the Tk thread"""
+        def on_sent(future):
+            error = future.exception()
+            if error is not None:
+                self.log(f"⚠️ Telegram {what} notification failed: {str(error)}")
+
+        self.run_in_background(func, on_sent, *args)
 
     def update_symbols(self):
         """Update symbol dropdown with comprehensive symbol list"""
@@ -433,27 +736,16 @@ class TradingBotGUI:
             # Get symbols from MT5 connection
             mt5_symbols = get_symbol_suggestions()
 
-            # Combine with default symbols for comprehensive coverage
-            from config import DEFAULT_SYMBOLS
-            all_symbols = list(set(mt5_symbols + DEFAULT_SYMBOLS))
-
-            # Sort symbols logically
-            forex_symbols = [s for s in all_symbols if any(pair in s.upper() for pair in ['EUR', 'GBP', 'USD', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD']) and len(s) <= 7]
-            metal_symbols = [s for s in all_symbols if any(metal in s.upper() for metal in ['XAU', 'XAG', 'GOLD', 'SILVER'])]
-            crypto_symbols = [s for s in all_symbols if any(crypto in s.upper() for crypto in ['BTC', 'ETH', 'LTC', 'XRP'])]
-            commodity_symbols = [s for s in all_symbols if any(comm in s.upper() for comm in ['OIL', 'NGAS', 'WHEAT'])]
-            index_symbols = [s for s in all_symbols if any(idx in s.upper() for idx in ['US30', 'US500', 'NAS100', 'GER30', 'UK100', 'JPN225'])]
+            # Combine with default symbols for comprehensive coverage; one set display dedups both
+            # sources in a single pass, then sorting gives the cache key and the category order
+            all_symbols = tuple(sorted({*mt5_symbols, *DEFAULT_SYMBOLS}))
 
             # Organize symbols by category
-            organized_symbols = []
-            if forex_symbols: organized_symbols.extend(sorted(forex_symbols))
-            if metal_symbols: organized_symbols.extend(sorted(metal_symbols))
-            if crypto_symbols: organized_symbols.extend(sorted(crypto_symbols))
-            if commodity_symbols: organized_symbols.extend(sorted(commodity_symbols))
-            if index_symbols: organized_symbols.extend(sorted(index_symbols))
+            organized_symbols, counts = _organize_symbols(all_symbols)
+            forex_count, metal_count, crypto_count, commodity_count, index_count = counts
 
             # Set symbols in dropdown
-            self.symbol_combo['values'] = organized_symbols[:50]  # Limit to 50 most common
+            self._set_symbols(organized_symbols[:50])  # Limit to 50 most common
 
             # Set default symbol
             if not self.symbol_combo.get() and organized_symbols:
@@ -468,75 +760,84 @@ class TradingBotGUI:
                     self.symbol_combo.set(organized_symbols[0])
 
             self.log(f"📊 Updated symbols: {len(organized_symbols)} available")
-            self.log(f"   Forex: {len(forex_symbols)}, Metals: {len(metal_symbols)}, Crypto: {len(crypto_symbols)}")
-            self.log(f"   Commodities: {len(commodity_symbols)}, Indices: {len(index_symbols)}")
+            self.log(f"   Forex: {forex_count}, Metals: {metal_count}, Crypto: {crypto_count}")
+            self.log(f"   Commodities: {commodity_count}, Indices: {index_count}")
 
         except Exception as e:
             self.log(f"❌ Error updating symbols: {str(e)}")
             # Fallback to basic symbols
             basic_symbols = ["XAUUSD", "XAUUSDm", "EURUSD", "GBPUSD", "USDJPY", "BTCUSD", "BTCUSDm", "USOIL", "USOILm"]
-            self.symbol_combo['values'] = basic_symbols
+            self._set_symbols(basic_symbols)
             if not self.symbol_combo.get():
                 self.symbol_combo.set("XAUUSDm")
 
+    def _set_symbols(self, symbols):
+        """Set the symbol dropdown values, skipping the Tk call when nothing changed"""
+        symbols = tuple(symbols)
+        if symbols != self._symbol_values:
+            self.symbol_combo.configure(values=symbols)
+            self._symbol_values = symbols
+
+    def _set_vars(self, updates):
+        """Apply (variable, value) pairs, skipping writes that would not change the field"""
+        for var, value in updates:
+            try:
+                current = var.get()
+            except tk.TclError:
+                current = None
+            if current != value:
+                var.set(value)
+
     def on_strategy_change(self, event=None):
         """Handle strategy change with proper GUI integration - ENHANCED"""
         try:
-            self.current_strategy = self.strategy_combo.get()
+            new_strategy = self.strategy_combo.get()
+            # Re-selecting the strategy already applied changes nothing; the first pick is always applied
+            if new_strategy == self._previous_strategy:
+                return
+            self.current_strategy = new_strategy
 
             # Enhanced strategy display with proper identification
-            strategy_display_name = {
-                "Scalping": "📈 SCALPING Strategy",
-                "Intraday": "⏰ INTRADAY Strategy",
-                "Arbitrage": "⚖️ ARBITRAGE Strategy",
-                "HFT": "⚡ HIGH FREQUENCY TRADING (HFT) Strategy"
-            }.get(self.current_strategy, f"🎯 {self.current_strategy} Strategy")
+            strategy_display_name = STRATEGY_DISPLAY_NAMES.get(self.current_strategy,
+                                                               f"🎯 {self.current_strategy} Strategy")
 
             self.log(f"⚙️ Strategy changed to: {strategy_display_name}")
 
             # Update parameters based on strategy
-            params = DEFAULT_PARAMS.get(self.current_strategy, DEFAULT_PARAMS["Scalping"])
+            params = DEFAULT_PARAMS.get(self.current_strategy, _FALLBACK_PARAMS)
 
-            # Update GUI fields with proper validation
-            self.lot_entry.delete(0, tk.END)
-            self.lot_entry.insert(0, params["lot_size"])
-
-            # TP/SL update with HFT-specific handling
+            tp_val = params["tp_pips"]
+            sl_val = params["sl_pips"]
             if self.current_strategy == "HFT":
                 # HFT has smaller TP/SL values - ensure correct display
-                tp_val = params["tp_pips"]
-                sl_val = params["sl_pips"]
                 self.log(f"🔧 HFT Strategy detected - Using precise values: TP={tp_val}, SL={sl_val}")
-            else:
-                tp_val = params["tp_pips"]
-                sl_val = params["sl_pips"]
 
-            self.tp_entry.delete(0, tk.END)
-            self.tp_entry.insert(0, str(tp_val))
-
-            self.sl_entry.delete(0, tk.END)
-            self.sl_entry.insert(0, str(sl_val))
-
-            self.tp_unit_combo.set(params["tp_unit"])
-            self.sl_unit_combo.set(params["sl_unit"])
+            # Update GUI fields in one pass, writing only the values that differ
+            self._set_vars((
+                (self.lot_var, params["lot_size"]),
+                (self.tp_var, tp_val),
+                (self.sl_var, sl_val),
+                (self.tp_unit_var, params["tp_unit"]),
+                (self.sl_unit_var, params["sl_unit"]),
+            ))
 
             # Enhanced logging with strategy-specific information
-            self.log(f"📊 {strategy_display_name} Parameters Updated:")
-            self.log(f"   💰 Lot Size: {params['lot_size']}")
-            self.log(f"   🎯 Take Profit: {tp_val} {params['tp_unit']}")
-            self.log(f"   🛡️ Stop Loss: {sl_val} {params['sl_unit']}")
-            self.log(f"   📊 Signal Threshold: {params.get('signal_threshold', 2)}")
-            self.log(f"   📏 Spread Range: {params.get('min_spread', 0)} - {params.get('max_spread', 5)} pips")
+            self.log(STRATEGY_PARAMS_TEMPLATE.format(
+                display_name=strategy_display_name,
+                lot_size=params['lot_size'],
+                tp=tp_val, tp_unit=params['tp_unit'],
+                sl=sl_val, sl_unit=params['sl_unit'],
+                signal_threshold=params.get('signal_threshold', 2),
+                min_spread=params.get('min_spread', 0),
+                max_spread=params.get('max_spread', 5)))
 
             # Send Telegram notification for strategy change
-            try:
-                old_strategy = getattr(self, '_previous_strategy', 'None')
-                tp_text = f"{tp_val} {params['tp_unit']}"
-                sl_text = f"{sl_val} {params['sl_unit']}"
-                notify_strategy_change(old_strategy, strategy_display_name, tp_text, sl_text, params['lot_size'])
-                self._previous_strategy = self.current_strategy
-            except Exception as e:
-                self.log(f"⚠️ Telegram strategy notification failed: {str(e)}")
+            old_strategy = self._previous_strategy or 'None'
+            tp_text = f"{tp_val} {params['tp_unit']}"
+            sl_text = f"{sl_val} {params['sl_unit']}"
+            self._notify_in_background("strategy", notify_strategy_change,
+                                       old_strategy, strategy_display_name, tp_text, sl_text, params['lot_size'])
+            self._previous_strategy = self.current_strategy
 
         except Exception as e:
             self.log(f"❌ Error changing strategy: {str(e)}")
@@ -644,7 +945,14 @@ class TradingBotGUI:
             self.log(f"❌ Error changing symbol: {str(e)}")
 
     def on_symbol_manual_input(self, event=None):
+        """Restart the validation timer on each keystroke so only the final symbol hits MT5"""
+        if self._symbol_input_after_id is not None:
+            self.root.after_cancel(self._symbol_input_after_id)
+        self._symbol_input_after_id = self.root.after(SYMBOL_INPUT_DEBOUNCE, self._validate_typed_symbol)
+
+    def _validate_typed_symbol(self):
         """Handle manual symbol input"""
+        self._symbol_input_after_id = None
         try:
             symbol = self.symbol_combo.get().upper()
             if len(symbol) >= 3:  # Minimum 3 characters for validation
@@ -662,11 +970,6 @@ class TradingBotGUI:
                 return False
 
             # Test symbol data availability
-            from data_manager import get_symbol_data
-            try:
-                import MetaTrader5 as mt5
-            except ImportError:
-                import mt5_mock as mt5
             test_data = get_symbol_data(symbol, timeframe=mt5.TIMEFRAME_M1, count=10)
 
             if test_data is not None and len(test_data) > 0:
@@ -674,10 +977,6 @@ class TradingBotGUI:
 
                 # Update symbol info display
                 try:
-                    try:
-                        import MetaTrader5 as mt5
-                    except ImportError:
-                        import mt5_mock as mt5
                     symbol_info = mt5.symbol_info(symbol)
                     tick_info = mt5.symbol_info_tick(symbol)
 
@@ -704,65 +1003,88 @@ class TradingBotGUI:
 
     def get_current_lot_size(self) -> float:
         """Get current lot size from GUI with validation"""
-        try:
-            lot_text = self.lot_entry.get().strip()
-            if not lot_text:
-                return 0.01
-            return validate_numeric_input(lot_text, min_val=0.01, max_val=100.0)
-        except:
-            self.log("⚠️ Invalid lot size, using 0.01")
-            return 0.01
+        return self._settings_snapshot()['lot_size']
 
     def get_current_tp(self) -> float:
         """Get current TP from GUI with validation"""
-        try:
-            tp_text = self.tp_entry.get().strip()
-            if not tp_text:
-                return 20.0
-            return validate_numeric_input(tp_text, min_val=0.0, max_val=1000.0)
-        except:
-            self.log("⚠️ Invalid TP value, using 20")
-            return 20.0
+        return self._settings_snapshot()['tp']
 
     def get_current_sl(self) -> float:
         """Get current SL from GUI with validation"""
-        try:
-            sl_text = self.sl_entry.get().strip()
-            if not sl_text:
-                return 10.0
-            return validate_numeric_input(sl_text, min_val=0.0, max_val=1000.0)
-        except:
-            self.log("⚠️ Invalid SL value, using 10")
-            return 10.0
+        return self._settings_snapshot()['sl']
+
+    def _setup_settings_tracking(self):
+        """Invalidate the settings snapshot whenever a parameter field is edited"""
+        for var in (self.strategy_var, self.symbol_var, self.lot_var, self.tp_var, self.sl_var,
+                    self.tp_unit_var, self.sl_unit_var, self.interval_var):
+            var.trace_add("write", self._invalidate_settings)
+
+        # Bound once so _build_settings walks a flat table instead of re-resolving each variable
+        self._numeric_fields = (
+            ('lot_size', self.lot_var.get, LOT_LIMITS),
+            ('tp', self.tp_var.get, TP_LIMITS),
+            ('sl', self.sl_var.get, SL_LIMITS),
+            ('interval', self.interval_var.get, INTERVAL_LIMITS),
+        )
+        self._unit_getters = (('tp_unit', self.tp_unit_var.get), ('sl_unit', self.sl_unit_var.get))
+
+    def _invalidate_settings(self, *args):
+        """Mark the cached settings snapshot as stale"""
+        self._settings_dirty = True
+
+    def get_current_settings(self) -> Dict[str, Any]:
+        """Get all trading parameters from the GUI, rebuilt only after a field changes"""
+        return dict(self._settings_snapshot())
+
+    def _settings_snapshot(self):
+        """The cached, validated settings (shared, not copied); re-read only after a field changes"""
+        if self._settings_dirty:
+            # Cleared before reading the fields: an edit traced during the build marks it dirty again
+            self._settings_dirty = False
+            try:
+                self._settings_cache = self._build_settings()
+            except tk.TclError:
+                # Widgets already destroyed (e.g. during shutdown)
+                self._settings_dirty = True
+                return DEFAULT_SETTINGS
+        return self._settings_cache
+
+    def _build_settings(self) -> Dict[str, Any]:
+        """Read every trading parameter field once and validate the values"""
+        settings = {'strategy': self.current_strategy, 'symbol': self.symbol_var.get()}
+        for key, get, limits in self._numeric_fields:
+            settings[key] = _read_number(get, *limits)
+        for key, get in self._unit_getters:
+            unit = get()
+            settings[key] = unit if unit in TP_SL_UNITS else "pips"
+        return settings
 
     def get_tp_unit(self) -> str:
         """Get TP unit from GUI dropdown - REAL-TIME USER SELECTION"""
         try:
             unit = self.tp_unit_combo.get()
-            if unit in ["pips", "price", "percent", "balance%", "equity%", "money"]:
-                logger(f"🔍 GUI: TP unit selected by user = {unit}")
-                return unit
-            else:
-                logger(f"⚠️ GUI: Invalid TP unit '{unit}', using default")
-                return "pips"
-        except Exception as e:
+        except tk.TclError as e:
             logger(f"❌ GUI: Error getting TP unit: {str(e)}")
             return "pips"
 
+        if unit in TP_SL_UNITS:
+            return unit
+        logger(f"⚠️ GUI: Invalid TP unit '{unit}', using default")
+        return "pips"
+
     def get_sl_unit(self) -> str:
         """Get SL unit from GUI dropdown - REAL-TIME USER SELECTION"""
         try:
             unit = self.sl_unit_combo.get()
-            if unit in ["pips", "price", "percent", "balance%", "equity%", "money"]:
-                logger(f"🔍 GUI: SL unit selected by user = {unit}")
-                return unit
-            else:
-                logger(f"⚠️ GUI: Invalid SL unit '{unit}', using default")
-                return "pips"
-        except Exception as e:
+        except tk.TclError as e:
             logger(f"❌ GUI: Error getting SL unit: {str(e)}")
             return "pips"
 
+        if unit in TP_SL_UNITS:
+            return unit
+        logger(f"⚠️ GUI: Invalid SL unit '{unit}', using default")
+        return "pips"
+
     def start_bot(self):
         """Start the trading bot"""
         try:
@@ -772,10 +1094,8 @@ class TradingBotGUI:
             self.stop_btn.config(state="normal")  # Enable Stop Bot button
 
             # Validate parameters
-            lot_size = self.get_current_lot_size()
-            tp = self.get_current_tp()
-            sl = self.get_current_sl()
-            symbol = self.symbol_combo.get()
+            settings = self.get_current_settings()
+            symbol = settings['symbol']
 
             if not symbol:
                 self.log("❌ Please select a symbol")
@@ -784,25 +1104,17 @@ class TradingBotGUI:
                 self.bot_status_lbl.config(text="Bot: Stopped 🔴", foreground="red")
                 return
 
-            self.log(f"⚙️ Bot Configuration:")
-            self.log(f"   Strategy: {self.current_strategy}")
-            self.log(f"   Symbol: {symbol}")
-            self.log(f"   Lot Size: {lot_size}")
-            self.log(f"   TP: {tp} {self.get_tp_unit()}")
-            self.log(f"   SL: {sl} {self.get_sl_unit()}")
+            self.log(BOT_CONFIG_TEMPLATE.format(**settings))
 
             # Start bot thread
-            import __main__
             __main__.start_bot_thread()
 
             self.bot_status_lbl.config(text="Bot: Running 🟢", foreground="green")
             self.log("✅ Trading bot started successfully!")
 
             # Send Telegram notification for bot start
-            try:
-                notify_bot_status("STARTED", f"Trading bot activated - Strategy: {self.current_strategy}, Symbol: {symbol}")
-            except Exception as telegram_e:
-                self.log(f"⚠️ Telegram start notification failed: {str(telegram_e)}")
+            self._notify_in_background("start", notify_bot_status, "STARTED",
+                                       f"Trading bot activated - Strategy: {self.current_strategy}, Symbol: {symbol}")
 
         except Exception as e:
             self.log(f"❌ Error starting bot: {str(e)}")
@@ -815,21 +1127,27 @@ class TradingBotGUI:
         try:
             self.log("🛑 STOP BUTTON PRESSED - Stopping trading bot immediately...")
             self.bot_status_lbl.config(text="Bot: Stopping... 🟡", foreground="orange")
+            self.stop_btn.config(state="disabled")
 
             # CRITICAL: Immediately disable bot operations
-            import __main__
-            from bot_controller import stop_bot
-
             # Set global stop flag immediately
             if hasattr(__main__, 'bot_running'):
                 __main__.bot_running = False
                 self.log("🔄 Global bot_running flag set to False")
 
-            # Call controller stop function
-            stop_bot()
+            # Controller stop joins the bot thread, so wait for it off the Tk thread
+            self.run_in_background(bot_controller.stop_bot, self._on_bot_stopped)
+
+        except Exception as e:
+            self._on_bot_stop_error(e)
+
+    def _on_bot_stopped(self, future):
+        """Finish stopping the bot once the controller has shut the bot thread down"""
+        try:
+            future.result()
             self.log("🔄 Bot controller stop function called")
 
-            # Force update GUI state immediately
+            # Update GUI state
             self.start_btn.config(state="normal")
             self.stop_btn.config(state="disabled")
             self.bot_status_lbl.config(text="Bot: Stopped 🔴", foreground="red")
@@ -837,35 +1155,32 @@ class TradingBotGUI:
             self.log("✅ Trading bot STOPPED - No more analysis or orders will be executed!")
 
             # Send Telegram notification for bot stop
-            try:
-                from telegram_notifications import notify_bot_status
-                notify_bot_status("STOPPED", f"Trading bot deactivated - Strategy: {self.current_strategy}")
-            except Exception as telegram_e:
-                self.log(f"⚠️ Telegram stop notification failed: {str(telegram_e)}")
-
-            # Force GUI refresh
-            self.root.update_idletasks()
+            self._notify_in_background("stop", notify_bot_status, "STOPPED",
+                                       f"Trading bot deactivated - Strategy: {self.current_strategy}")
 
         except Exception as e:
-            self.log(f"❌ Error stopping bot: {str(e)}")
-            # Force stop regardless of error
-            import __main__
-            if hasattr(__main__, 'bot_running'):
-                __main__.bot_running = False
-            # Restore button states on error
-            self.start_btn.config(state="normal")
-            self.stop_btn.config(state="disabled")
-            self.bot_status_lbl.config(text="Bot: Force Stopped 🔴", foreground="red")
+            self._on_bot_stop_error(e)
+
+    def _on_bot_stop_error(self, e: Exception):
+        """Force the bot into the stopped state after a failed stop"""
+        self.log(f"❌ Error stopping bot: {str(e)}")
+        # Force stop regardless of error
+        if hasattr(__main__, 'bot_running'):
+            __main__.bot_running = False
+        # Restore button states on error
+        self.start_btn.config(state="normal")
+        self.stop_btn.config(state="disabled")
+        self.bot_status_lbl.config(text="Bot: Force Stopped 🔴", foreground="red")
 
     def emergency_stop(self):
         """Emergency stop all operations"""
         try:
             self.log("🚨 EMERGENCY STOP ACTIVATED!")
 
-            # Stop bot
-            import __main__
+            # Stop bot: wakes the trading loop out of any wait at once
             if hasattr(__main__, 'bot_running'):
                 __main__.bot_running = False
+            bot_controller.request_stop()
 
             # Update button states
             self.start_btn.config(state="normal")
@@ -885,11 +1200,31 @@ class TradingBotGUI:
 
     def close_all_positions(self):
         """Close all open positions"""
+        # A close already in flight covers every position; don't queue a second one
+        if self._closing_positions:
+            self.log("⏳ Already closing positions...")
+            return
         try:
             self.log("🔄 Closing all open positions...")
+            self._closing_positions = True
+            self._set_close_button_state()
+
+            self.run_in_background(trading_operations.close_all_positions, self._on_positions_closed)
+
+        except Exception as e:
+            self.log(f"❌ Error closing positions: {str(e)}")
+            self._closing_positions = False
+            self._set_close_button_state()
 
-            from trading_operations import close_all_orders
-            close_all_orders()
+    def _set_close_button_state(self):
+        """Enable the close button only while connected and no close request is running"""
+        usable = self._mt5_connected and not self._closing_positions
+        self.close_btn.config(state="normal" if usable else "disabled")
+
+    def _on_positions_closed(self, future):
+        """Refresh positions after close_all_positions and re-enable the close button"""
+        try:
+            future.result()
 
             # Update positions display
             self.update_positions()
@@ -898,116 +1233,199 @@ class TradingBotGUI:
 
         except Exception as e:
             self.log(f"❌ Error closing positions: {str(e)}")
+        finally:
+            self._closing_positions = False
+            self._set_close_button_state()
 
     def update_gui_data(self):
         """Ultra-responsive GUI with real-time market analysis and profit optimization"""
         try:
-            update_start = datetime.datetime.now()
-            self._update_counter += 1
+            # Nothing is visible while minimized: skip the MT5 queries and just poll for a restore
+            if self.root.state() in ("iconic", "withdrawn"):
+                self._gui_update_delay = GUI_HIDDEN_INTERVAL
+                self._schedule_gui_update()
+                return
 
-            # Track update performance
-            if self._update_counter % 10 == 0:
-                time_since_last = (update_start - self._last_update_time).total_seconds()
-                update_interval = time_since_last / 10
-                if update_interval > 2.0:
-                    logger(f"⚠️ Slow GUI update detected: {update_interval:.1f}s")
+            # MT5 is queried on the worker pool so a slow terminal never freezes the window;
+            # the next update is only scheduled once this one has been applied
+            self._update_start = time.perf_counter()
+            self.run_in_background(self._collect_status, self._on_status_collected)
 
-            # Update account information
-            self.update_account_info()
+        except Exception as e:
+            self._on_gui_update_error(e)
 
-            # Update positions display
-            self.update_positions()
+    def _on_status_collected(self, future):
+        """Apply a collected status snapshot on the Tk thread and schedule the next update"""
+        try:
+            self._update_counter += 1
 
-            # Update order count display
-            self.update_order_count_display()
+            # Apply the account and positions snapshot in one pass
+            self._apply_status(future.result())
 
-            # Update daily order count display
-            self.update_daily_order_count_display()
+            # Track update performance: average time spent per update over the recent samples
+            durations = self._update_durations
+            durations.append(time.perf_counter() - self._update_start)
+            update_time = sum(durations) / len(durations)
+            if self._update_counter % GUI_TIMING_SAMPLES == 0 and update_time > 2.0:
+                logger(f"⚠️ Slow GUI update detected: {update_time:.1f}s")
 
-            # Log performance update periodically
-            if self._update_counter % 20 == 0:
-                try:
-                    info = get_account_info()
-                    positions = get_positions()
-                    position_count = len(positions) if positions else 0
-
-                    if info:
-                        logger(f"📊 GUI Update #{self._update_counter}: Balance=${info['balance']:.2f}, Equity=${info['equity']:.2f}, Positions={position_count}")
-                    else:
-                        logger(f"📊 GUI Update #{self._update_counter}: MT5 disconnected")
-                except Exception as perf_e:
-                    pass
+            # Hold the target update rate: subtract the time updates take from the wait
+            self._gui_update_delay = max(GUI_MIN_DELAY, GUI_UPDATE_INTERVAL - int(update_time * 1000))
+            self._schedule_gui_update()
 
         except Exception as e:
-            logger(f"❌ GUI update error: {str(e)}")
+            self._on_gui_update_error(e)
+
+    def _on_gui_update_error(self, e: Exception):
+        """Log a failed GUI update and retry later, backing off while errors persist"""
+        logger(f"❌ GUI update error: {str(e)}")
+        now = time.monotonic()
+        if now - self._last_traceback_at >= GUI_TRACEBACK_INTERVAL:
+            self._last_traceback_at = now
             try:
                 # Log detailed error info
                 logger(f"📝 GUI update traceback: {traceback.format_exc()}")
             except:
                 pass
-        finally:
-            # Schedule next update
-            self.root.after(GUI_UPDATE_INTERVAL, self.update_gui_data)
-            self._last_update_time = datetime.datetime.now()
+
+        # Back off while errors persist instead of retrying at full rate
+        self._gui_update_delay = min(self._gui_update_delay * 2, GUI_MAX_BACKOFF)
+        self._schedule_gui_update()
+
+    def _schedule_gui_update(self):
+        """Schedule the next periodic GUI update unless the window is shutting down"""
+        if self._alive.is_set():
+            try:
+                self._gui_update_after_id = self.root.after(self._gui_update_delay, self.update_gui_data)
+            except tk.TclError:
+                pass
+
+    def _collect_status(self) -> Dict[str, Any]:
+        """Fetch one snapshot of the MT5 data shown by the periodic GUI update"""
+        return {
+            'account': get_account_info(),
+            'positions': get_positions()
+        }
+
+    def _apply_status(self, snapshot: Dict[str, Any]):
+        """Apply a status snapshot to every periodically refreshed widget"""
+        info = snapshot['account']
+        positions = snapshot['positions']
+
+        # Update account information
+        self._show_account_info(info)
+
+        # Update positions display
+        self.update_positions(positions)
+
+        # Update order count display
+        self.update_order_count_display()
+
+        # Update daily order count display
+        self.update_daily_order_count_display()
+
+        # Log performance update periodically (DEBUG; skipped without formatting when filtered out)
+        if self._update_counter % 20 == 0 and is_enabled(DEBUG):
+            try:
+                position_count = len(positions) if positions else 0
+
+                if info:
+                    logger(f"📊 GUI Update #{self._update_counter}: Balance=${info['balance']:.2f}, Equity=${info['equity']:.2f}, Positions={position_count}", DEBUG)
+                else:
+                    logger(f"📊 GUI Update #{self._update_counter}: MT5 disconnected", DEBUG)
+            except Exception as perf_e:
+                pass
 
     def update_account_info(self):
         """Update account information display"""
-        try:
-            info = get_account_info()
+        self._show_account_info(get_account_info())
 
+    def _show_account_info(self, info: Optional[Dict[str, Any]]):
+        """Show account info in the labels, or the disconnected state when info is None"""
+        try:
             if info:
-                self.balance_lbl.config(text=f"Balance: ${info['balance']:.2f}", foreground="white")
-                self.equity_lbl.config(text=f"Equity: ${info['equity']:.2f}", foreground="white")
-                self.margin_lbl.config(text=f"Free Margin: ${info['free_margin']:.2f}", foreground="white")
+                # Quiet market: nothing shown would change
+                account = (info['balance'], info['equity'], info['free_margin'], info['margin_level'], info['server'])
+                if account == self._last_account:
+                    return
+                self._last_account = account
+
+                for attr, template in ACCOUNT_LABEL_TEMPLATES:
+                    self._show_account_label(attr, template.format_map(info), "white")
 
                 if info['margin_level'] > 0:
                     margin_color = "green" if info['margin_level'] > 200 else "orange" if info['margin_level'] > 100 else "red"
-                    self.margin_level_lbl.config(text=f"Margin Level: {info['margin_level']:.1f}%",
-                                               foreground=margin_color)
+                    self._show_account_label("margin_level_lbl", f"Margin Level: {info['margin_level']:.1f}%",
+                                             margin_color)
                 else:
-                    self.margin_level_lbl.config(text="Margin Level: N/A", foreground="gray")
-
-                self.server_lbl.config(text=f"Server: {info['server']}", foreground="white")
+                    self._show_account_label("margin_level_lbl", "Margin Level: N/A", "gray")
 
             else:
                 # Show disconnected state
-                self.balance_lbl.config(text="Balance: Disconnected", foreground="gray")
-                self.equity_lbl.config(text="Equity: Disconnected", foreground="gray")
-                self.margin_lbl.config(text="Free Margin: Disconnected", foreground="gray")
-                self.margin_level_lbl.config(text="Margin Level: Disconnected", foreground="gray")
-                self.server_lbl.config(text="Server: Disconnected", foreground="gray")
+                self._show_account_placeholder("Disconnected")
 
         except Exception as e:
             logger(f"❌ Error updating account info: {str(e)}")
 
-    def update_positions(self):
-        """Update positions display"""
+    def _show_account_placeholder(self, value: str):
+        """Show the same greyed-out placeholder value in every account label"""
+        self._last_account = None
+        for attr, caption, _ in ACCOUNT_LABELS:
+            self._show_account_label(attr, f"{caption}: {value}", "gray")
+
+    def _show_account_label(self, attr: str, text: str, foreground: str):
+        """Set an account label's StringVar and colour, touching Tk only for values that changed"""
+        var = self._account_vars[attr]
+        state_key = (str(var), "value")
+        if self._widget_state.get(state_key) != text:
+            self._widget_state[state_key] = text
+            var.set(text)
+        self._configure_if_changed(getattr(self, attr), foreground=foreground)
+
+    def update_positions(self, positions=None):
+        """Update positions display, touching only rows that were opened, changed or closed"""
         try:
-            # Clear existing items
-            for item in self.positions_tree.get_children():
-                self.positions_tree.delete(item)
-
-            positions = get_positions()
-
-            if positions:
-                for pos in positions:
-                    pos_type = "BUY" if pos.type == 0 else "SELL"
-                    profit_color = "green" if pos.profit >= 0 else "red"
-
-                    item = self.positions_tree.insert("", "end", values=(
-                        pos.symbol,
-                        pos_type,
-                        f"{pos.volume:.2f}",
-                        f"{pos.price_open:.5f}",
-                        f"{pos.price_current:.5f}",
-                        f"${pos.profit:.2f}"
-                    ))
-
-                    # Color code profitable/losing positions
-                    if pos.profit >= 0:
-                        self.positions_tree.set(item, "Profit", f"${pos.profit:.2f}")
-                    else:
-                        self.positions_tree.set(item, "Profit", f"${pos.profit:.2f}")
+            if positions is None:
+                positions = get_positions()
+
+            # Skip formatting every row when no shown field of any position has moved
+            snapshot = tuple((pos.ticket, pos.symbol, pos.type, pos.volume, pos.price_open,
+                              pos.tp, pos.sl, pos.price_current, pos.profit) for pos in positions or ())
+            if snapshot == self._last_positions:
+                return
+
+            tree = self.positions_tree
+            rows = self._position_rows
+            open_tickets = set()
+
+            for pos in positions or ():
+                iid = str(pos.ticket)
+                open_tickets.add(iid)
+                values = (
+                    pos.symbol,
+                    "BUY" if pos.type == 0 else "SELL",
+                    f"{pos.volume:.2f}",
+                    f"{pos.price_open:.5f}",
+                    f"{pos.tp:.5f}",
+                    f"{pos.sl:.5f}",
+                    f"{pos.price_current:.5f}",
+                    f"${pos.profit:.2f}"
+                )
+
+                if iid not in rows:
+                    tree.insert("", "end", iid=iid, values=values)
+                elif rows[iid] != values:
+                    tree.item(iid, values=values)
+                rows[iid] = values
+
+            # Drop rows for positions that have been closed, all in one delete call
+            closed = [iid for iid in rows if iid not in open_tickets]
+            if closed:
+                tree.delete(*closed)
+                for iid in closed:
+                    del rows[iid]
+
+            self._last_positions = snapshot
 
         except Exception as e:
             logger(f"❌ Error updating positions: {str(e)}")
@@ -1024,47 +1442,72 @@ class TradingBotGUI:
             self.log(f"❌ Error refreshing data: {str(e)}")
 
     def show_performance_report(self):
-        """Show performance report in popup"""
+        """Generate the performance report (MT5 queries + file write) on the worker pool"""
+        self.run_in_background(generate_performance_report, self._on_report_ready)
+
+    def _on_report_ready(self, future):
+        """Show a generated performance report in the popup"""
         try:
-            report = generate_performance_report()
+            report = future.result()
 
-            # Create popup window
-            report_window = tk.Toplevel(self.root)
-            report_window.title("📊 Performance Report")
-            report_window.geometry("800x600")
-            report_window.configure(bg="#0f0f0f")
+            # Build the popup on first use, then reuse it
+            if self._report_text is None or not self._report_text.winfo_exists():
+                self._build_report_window()
 
-            # Report text
-            report_text = ScrolledText(report_window, bg="#1a1a1a", fg="white",
-                                     font=("Consolas", 10))
-            report_text.pack(fill="both", expand=True, padx=10, pady=10)
+            self._report_text.config(state="normal")
+            self._report_text.delete("1.0", tk.END)
+            self._report_text.insert("1.0", report)
+            self._report_text.config(state="disabled")
 
-            report_text.insert("1.0", report)
-            report_text.config(state="disabled")
+            report_window = self._report_text.winfo_toplevel()
+            report_window.deiconify()
+            report_window.lift()
 
             self.log("📊 Performance report displayed")
 
         except Exception as e:
             self.log(f"❌ Error showing report: {str(e)}")
 
+    def _build_report_window(self):
+        """Create the performance report popup; closing it only hides it"""
+        report_window = tk.Toplevel(self.root)
+        report_window.title("📊 Performance Report")
+        report_window.geometry("800x600")
+        report_window.configure(bg="#0f0f0f")
+        report_window.protocol("WM_DELETE_WINDOW", report_window.withdraw)
+
+        # Report text
+        # Rewritten wholesale on every refresh, so no undo history either
+        self._report_text = ScrolledText(report_window, bg="#1a1a1a", fg="white",
+                                         font=("Consolas", 10),
+                                         undo=False, autoseparators=False, maxundo=0)
+        self._report_text.pack(fill="both", expand=True, padx=10, pady=10)
+
     def clear_log(self):
-        """Clear the log display"""
+        """Clear the log display, including lines still queued for the next flush"""
         try:
+            # The widget is capped at MAX_LOG_LINES, so this delete is bounded
+            self._log_buf.clear()
             self.log_text.delete("1.0", tk.END)
+            self._log_line_count = 1
             self.log("🗑️ Log cleared")
         except Exception as e:
             logger(f"❌ Error clearing log: {str(e)}")
 
     def log(self, message: str):
-        """Add message to log display"""
+        """Add message to log display (safe to call from any thread)"""
         try:
             # Check if GUI is still valid before attempting to log
-            if not hasattr(self, 'log_text') or not self.log_text or not self.log_text.winfo_exists():
+            if getattr(self, 'log_text', None) is None or self._shutdown_in_progress:
                 # GUI is destroyed, fallback to console
                 print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] {message}")
                 return
 
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            now = int(time.time())
+            second, timestamp = self._log_stamp
+            if now != second:
+                timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+                self._log_stamp = (now, timestamp)
             log_entry = f"[{timestamp}] {message}\n"
 
             # ENHANCED: Filter out repetitive and non-essential log messages
@@ -1085,13 +1528,7 @@ class TradingBotGUI:
                     break
 
             if should_display:
-                self.log_text.insert(tk.END, log_entry)
-                self.log_text.see(tk.END)
-
-            # Limit log size to prevent memory issues
-            lines = int(self.log_text.index('end-1c').split('.')[0])
-            if lines > 1000:
-                self.log_text.delete("1.0", "100.0")
+                self._log_buf.append(log_entry)
 
         except tk.TclError:
             # GUI component destroyed, use console
@@ -1100,6 +1537,58 @@ class TradingBotGUI:
             # Other errors, still fallback to console
             print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] {message}")
 
+    def _flush_logs(self):
+        """Write up to LOG_FLUSH_BATCH buffered log lines to the log display in a single insert"""
+        if not self._alive.is_set():
+            return
+
+        chunk = []
+        buf = self._log_buf
+        while buf and len(chunk) < LOG_FLUSH_BATCH:
+            chunk.append(buf.popleft())
+
+        try:
+            # Reschedule first so a failed insert never stops the drain loop
+            self._log_flush_after_id = self.root.after(50, self._flush_logs)
+            if not chunk:
+                return
+
+            if not self.log_text or not self.log_text.winfo_exists():
+                print("".join(chunk), end="")
+                return
+
+            text = "".join(chunk)
+            self.log_text.insert("logtail", text)
+            self.log_text.see("logtail")
+
+            # Limit log size to prevent memory issues; the line count is tracked, not queried from Tk
+            self._log_line_count += text.count("\n")
+            if self._log_line_count > MAX_LOG_LINES:
+                keep = MAX_LOG_LINES - LOG_TRIM_LINES
+                self.log_text.delete("1.0", f"{self._log_line_count - keep}.0")
+                self._log_line_count = keep + 1
+
+        except tk.TclError:
+            # GUI component destroyed, use console
+            print("".join(chunk), end="")
+
+    def stop_background_work(self):
+        """Stop recurring GUI updates and the worker pool before the window is destroyed"""
+        self._shutdown_in_progress = True
+        self._alive.clear()
+
+        for after_id in (self._gui_update_after_id, self._log_flush_after_id, self._symbol_input_after_id):
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+        self._gui_update_after_id = None
+        self._log_flush_after_id = None
+        self._symbol_input_after_id = None
+
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
     def on_closing(self):
         """Handle GUI closing event"""
         try:
@@ -1110,17 +1599,11 @@ class TradingBotGUI:
             print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] 🔄 Shutting down trading bot...")
 
             # Stop bot if running
-            import __main__
             if hasattr(__main__, 'bot_running'):
                 __main__.bot_running = False
 
-            # Cancel any pending GUI updates
-            if hasattr(self, 'root') and self.root:
-                # Cancel all pending after() calls
-                try:
-                    self.root.after_cancel("all")
-                except:
-                    pass
+            # Cancel any pending GUI updates and background work
+            self.stop_background_work()
 
             # Clean up GUI components
             if hasattr(self, 'log_text'):
@@ -1131,7 +1614,6 @@ class TradingBotGUI:
                 self.log_text = None
 
             # Give time for cleanup
-            import time
             time.sleep(0.5)
 
             # Destroy root window
@@ -1147,28 +1629,19 @@ class TradingBotGUI:
             except:
                 pass
 
-    def get_current_lot_size(self) -> float:
-        """Get current lot size for TP/SL percentage calculations"""
-        try:
-            return float(self.lot_entry.get())
-        except:
-            return 0.01
-
     def set_order_limit(self):
         """Set new order limit from GUI input"""
         try:
             new_limit = int(self.max_orders_entry.get())
 
-            from risk_management import set_max_orders_limit
             if set_max_orders_limit(new_limit):
                 self.log(f"✅ Order limit set to: {new_limit}")
                 self.update_order_count_display()
             else:
                 self.log(f"❌ Invalid order limit: {new_limit}")
                 # Reset to current value
-                from risk_management import max_orders_limit
                 self.max_orders_entry.delete(0, tk.END)
-                self.max_orders_entry.insert(0, str(max_orders_limit))
+                self.max_orders_entry.insert(0, str(risk_management.max_orders_limit))
 
         except ValueError:
             self.log("❌ Order limit must be a number")
@@ -1178,17 +1651,26 @@ class TradingBotGUI:
     def reset_order_count(self):
         """Reset order count from GUI"""
         try:
-            from risk_management import reset_order_count
             reset_order_count()
             self.update_order_count_display()
             self.log("🔄 Order count reset to 0")
         except Exception as e:
             self.log(f"❌ Error resetting order count: {str(e)}")
 
+    def _configure_if_changed(self, widget, **options):
+        """Configure widget options, skipping values that were already applied"""
+        changed = {}
+        for key, value in options.items():
+            state_key = (str(widget), key)
+            if self._widget_state.get(state_key) != value:
+                self._widget_state[state_key] = value
+                changed[key] = value
+        if changed:
+            widget.configure(**changed)
+
     def update_order_count_display(self):
         """Update order count display in GUI - SILENT VERSION"""
         try:
-            from risk_management import get_order_limit_status
             status = get_order_limit_status()
 
             count_text = f"{status['current_count']}/{status['max_limit']}"
@@ -1211,7 +1693,7 @@ class TradingBotGUI:
 
             # Update GUI label
             if hasattr(self, 'order_count_lbl'):
-                self.order_count_lbl.config(text=display_text, foreground=color)
+                self._configure_if_changed(self.order_count_lbl, text=display_text, foreground=color)
 
             # Update max orders entry field to show current limit
             if hasattr(self, 'max_orders_entry'):
@@ -1223,13 +1705,12 @@ class TradingBotGUI:
         except Exception as e:
             error_text = "❌ ERR"
             if hasattr(self, 'order_count_lbl'):
-                self.order_count_lbl.config(text=error_text, foreground="red")
+                self._configure_if_changed(self.order_count_lbl, text=error_text, foreground="red")
             # Silent error - no logging to avoid spam
 
     def update_daily_order_count_display(self):
         """Update daily order count display in GUI - SILENT VERSION"""
         try:
-            from risk_management import get_daily_order_limit_status
             status = get_daily_order_limit_status()
 
             count_text = f"{status['current_daily_count']}/{status['max_daily_limit']}"
@@ -1259,7 +1740,7 @@ class TradingBotGUI:
                 self.daily_order_count_lbl = ttk.Label(parent_frame, text=display_text, foreground=color)
                 self.daily_order_count_lbl.grid(row=0, column=2, padx=(15, 5))
             else:
-                self.daily_order_count_lbl.config(text=display_text, foreground=color)
+                self._configure_if_changed(self.daily_order_count_lbl, text=display_text, foreground=color)
 
             # ONLY log critical warnings - no regular updates
             if status['daily_percentage_used'] >= 90 and not hasattr(self, '_daily_warning_shown'):
@@ -1269,5 +1750,5 @@ class TradingBotGUI:
         except Exception as e:
             error_text = "❌ ERR"
             if hasattr(self, 'daily_order_count_lbl'):
-                self.daily_order_count_lbl.config(text=error_text, foreground="red")
+                self._configure_if_changed(self.daily_order_count_lbl, text=error_text, foreground="red")
             # Silent error - no logging to avoid spam
\ No newline at end of file
@@ -3,10 +3,95 @@
 Technical analysis indicators and calculations
 """
 
+import hashlib
+import threading
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from numpy.lib.stride_tricks import sliding_window_view
 from logger_utils import logger
-from typing import Any
+from typing import Any, Optional
+
+# Frames whose indicators were already computed, keyed by _frame_key; oldest entries evicted first
+INDICATOR_CACHE_SIZE = 16
+_indicator_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_indicator_cache_lock = threading.Lock()
+
+# Input columns whose full contents go into the cache key
+KEY_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'tick_volume')
+
+
+def _frame_key(df: Any) -> tuple:
+    """Identify a bar frame by a digest of its index and full input columns
+
+    Two frames share a key only when every input value matches, so frames of different
+    symbols or timeframes can never pick up each other's indicators.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    index = df.index
+    if isinstance(index, pd.RangeIndex):
+        digest.update(repr((index.start, index.stop, index.step)).encode())
+    else:
+        values = index.to_numpy()
+        digest.update(values.tobytes() if values.dtype.kind in 'biufmM' else repr(tuple(values)).encode())
+    for col in KEY_COLUMNS:
+        if col in df.columns:
+            values = df[col].to_numpy()
+            digest.update(col.encode())
+            digest.update(values.tobytes() if values.dtype.kind in 'biufmM' else repr(tuple(values)).encode())
+    return (len(df), tuple(df.columns), digest.digest())
+
+
+# Bounded 0-100 oscillators, only compared against fixed thresholds, stored as float32.
+# Price-scale columns (EMA/WMA/BB/ATR/MACD) stay float64: float32 keeps ~7 significant
+# digits, too few for differences of gold/crypto prices.
+FLOAT32_COLUMNS = ('RSI', 'RSI_fast', 'RSI_slow', '%K', '%D')
+
+# EMA periods added as EMA<span> columns
+EMA_SPANS = (8, 12, 20, 26, 50, 100, 200)
+# Per frame (first bar time, first close): (closes seen, {span: EMA array})
+_ema_state: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def _incremental_emas(close: np.ndarray, frame_id: tuple) -> dict:
+    """EMA (adjust=False) for every span in EMA_SPANS, stepping only over bars added or changed since the last call
+
+    The last bar seen may still have been forming, so it is always recomputed. Everything before it is
+    reused only if every one of those closes is unchanged; a revised earlier bar, a rebased or shorter
+    window falls back to a full ewm pass.
+    """
+    n = len(close)
+    with _indicator_cache_lock:
+        state = _ema_state.get(frame_id)
+
+    start = 0
+    if state is not None:
+        seen_close, previous = state
+        closed = len(seen_close) - 1
+        if 1 <= closed < n and np.array_equal(close[:closed], seen_close[:closed]):
+            start = closed
+
+    emas = {}
+    for span in EMA_SPANS:
+        if start == 0:
+            emas[span] = pd.Series(close).ewm(span=span, adjust=False).mean().to_numpy()
+            continue
+        alpha = 2.0 / (span + 1)
+        ema = np.empty(n)
+        ema[:start] = previous[span][:start]
+        value = ema[start - 1]
+        for i in range(start, n):
+            value = alpha * close[i] + (1 - alpha) * value
+            ema[i] = value
+        emas[span] = ema
+
+    with _indicator_cache_lock:
+        _ema_state[frame_id] = (close.copy(), emas)
+        _ema_state.move_to_end(frame_id)
+        if len(_ema_state) > INDICATOR_CACHE_SIZE:
+            _ema_state.popitem(last=False)
+    return emas
 
 
 def calculate_indicators(df: Any) -> Any:
@@ -18,102 +103,141 @@ def calculate_indicators(df: Any) -> Any:
             logger("⚠️ Insufficient data for indicator calculation")
             return None
 
-        # Core EMA indicators with optimized periods for each strategy
-        df['EMA8'] = df['close'].ewm(span=8, adjust=False).mean()  # Additional EMA for better signals
-        df['EMA12'] = df['close'].ewm(span=12, adjust=False).mean()
-        df['EMA20'] = df['close'].ewm(span=20, adjust=False).mean()
-        df['EMA26'] = df['close'].ewm(span=26, adjust=False).mean()
-        df['EMA50'] = df['close'].ewm(span=50, adjust=False).mean()
-        df['EMA100'] = df['close'].ewm(span=100, adjust=False).mean()
-        df['EMA200'] = df['close'].ewm(span=200, adjust=False).mean()
+        # Same bars as a previous call (e.g. several refreshes within one bar): reuse that result.
+        # Callers get a copy so mutating the returned frame never touches the cached one.
+        key = _frame_key(df)
+        with _indicator_cache_lock:
+            cached = _indicator_cache.get(key)
+            if cached is not None:
+                _indicator_cache.move_to_end(key)
+                return cached.copy()
+
+        # Indicator columns are collected in cols (arrays/Series) and attached to df once at the end
+        # Core EMA indicators with optimized periods for each strategy (EMA8 added for better signals)
+        close = df['close'].to_numpy(dtype=np.float64)
+        first_time = df['time'].iat[0] if 'time' in df.columns else df.index[0]
+        cols = {f'EMA{span}': ema for span, ema in _incremental_emas(close, (first_time, close[0])).items()}
 
         # Price position relative to EMAs
-        df['price_above_ema20'] = df['close'] > df['EMA20']
-        df['price_above_ema50'] = df['close'] > df['EMA50']
-        df['price_above_ema200'] = df['close'] > df['EMA200']
+        cols['price_above_ema20'] = df['close'] > cols['EMA20']
+        cols['price_above_ema50'] = df['close'] > cols['EMA50']
+        cols['price_above_ema200'] = df['close'] > cols['EMA200']
 
         # EMA slopes for trend strength
-        df['ema20_slope'] = df['EMA20'].diff()
-        df['ema50_slope'] = df['EMA50'].diff()
+        cols['ema20_slope'] = np.diff(cols['EMA20'], prepend=np.nan)
+        cols['ema50_slope'] = np.diff(cols['EMA50'], prepend=np.nan)
 
         # WMA calculations
-        def wma(series, period):
-            weights = np.arange(1, period + 1)
-            return series.rolling(period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
-
-        df['WMA8'] = wma(df['close'], 8)
-        df['WMA14'] = wma(df['close'], 14)
-        df['WMA21'] = wma(df['close'], 21)
+        cols['WMA8'] = wma(close, 8)
+        cols['WMA14'] = wma(close, 14)
+        cols['WMA21'] = wma(close, 21)
 
         # RSI calculation with multiple periods
-        df['RSI'] = calculate_rsi(df['close'], 14)
-        df['RSI_fast'] = calculate_rsi(df['close'], 7)  # Faster RSI for scalping
-        df['RSI_slow'] = calculate_rsi(df['close'], 21)  # Slower RSI for trends
+        cols['RSI'] = calculate_rsi(df['close'], 14)
+        cols['RSI_fast'] = calculate_rsi(df['close'], 7)  # Faster RSI for scalping
+        cols['RSI_slow'] = calculate_rsi(df['close'], 21)  # Slower RSI for trends
 
         # RSI overbought/oversold levels
-        df['RSI_oversold'] = df['RSI'] < 30
-        df['RSI_overbought'] = df['RSI'] > 70
-        df['RSI_neutral'] = (df['RSI'] >= 30) & (df['RSI'] <= 70)
+        cols['RSI_oversold'] = cols['RSI'] < 30
+        cols['RSI_overbought'] = cols['RSI'] > 70
+        cols['RSI_neutral'] = (cols['RSI'] >= 30) & (cols['RSI'] <= 70)
 
-        # MACD with enhanced parameters
-        df['MACD'], df['MACD_signal'], df['MACD_histogram'] = macd_enhanced(
-            df['close'], fast=12, slow=26, signal=9)
+        # MACD with enhanced parameters, built from the EMA12/EMA26 columns computed above
+        cols['MACD'], cols['MACD_signal'], cols['MACD_histogram'] = macd_from_emas(
+            pd.Series(cols['EMA12'], index=df.index), pd.Series(cols['EMA26'], index=df.index), signal=9)
 
         # MACD signals
-        df['MACD_bullish'] = (df['MACD'] > df['MACD_signal']) & (df['MACD_histogram'] > 0)
-        df['MACD_bearish'] = (df['MACD'] < df['MACD_signal']) & (df['MACD_histogram'] < 0)
+        cols['MACD_bullish'] = (cols['MACD'] > cols['MACD_signal']) & (cols['MACD_histogram'] > 0)
+        cols['MACD_bearish'] = (cols['MACD'] < cols['MACD_signal']) & (cols['MACD_histogram'] < 0)
 
         # Stochastic
-        df['%K'], df['%D'] = stochastic_enhanced(df, k_period=14, d_period=3)
-        df['stoch_oversold'] = df['%K'] < 20
-        df['stoch_overbought'] = df['%K'] > 80
+        cols['%K'], cols['%D'] = stochastic_enhanced(df, k_period=14, d_period=3)
+        cols['stoch_oversold'] = cols['%K'] < 20
+        cols['stoch_overbought'] = cols['%K'] > 80
 
-        # ATR for volatility
-        df['ATR'] = atr(df, period=14)
-        df['ATR_fast'] = atr(df, period=7)  # Faster ATR for scalping
+        # ATR for volatility; both periods share one true-range pass
+        tr = _true_range(df) if all(col in df.columns for col in ('high', 'low', 'close')) else None
+        cols['ATR'] = atr(df, period=14, true_range=tr)
+        cols['ATR_fast'] = atr(df, period=7, true_range=tr)  # Faster ATR for scalping
 
         # Bollinger Bands
-        df['BB_middle'] = df['close'].rolling(20).mean()
+        cols['BB_middle'] = df['close'].rolling(20).mean()
         bb_std = df['close'].rolling(20).std()
-        df['BB_upper'] = df['BB_middle'] + (bb_std * 2)
-        df['BB_lower'] = df['BB_middle'] - (bb_std * 2)
-        df['BB_width'] = (df['BB_upper'] - df['BB_lower']) / df['BB_middle']
+        cols['BB_upper'] = cols['BB_middle'] + (bb_std * 2)
+        cols['BB_lower'] = cols['BB_middle'] - (bb_std * 2)
+        cols['BB_width'] = (cols['BB_upper'] - cols['BB_lower']) / cols['BB_middle']
 
         # Price position relative to Bollinger Bands
-        df['price_above_bb_upper'] = df['close'] > df['BB_upper']
-        df['price_below_bb_lower'] = df['close'] < df['BB_lower']
-        df['price_near_bb_middle'] = abs(df['close'] - df['BB_middle']) / df['BB_middle'] < 0.002
+        cols['price_above_bb_upper'] = df['close'] > cols['BB_upper']
+        cols['price_below_bb_lower'] = df['close'] < cols['BB_lower']
+        cols['price_near_bb_middle'] = abs(df['close'] - cols['BB_middle']) / cols['BB_middle'] < 0.002
 
         # Volume analysis (if available)
         if 'tick_volume' in df.columns:
-            df['volume_ma'] = df['tick_volume'].rolling(20).mean()
-            df['volume_ratio'] = df['tick_volume'] / df['volume_ma']
+            cols['volume_ma'] = df['tick_volume'].rolling(20).mean()
+            cols['volume_ratio'] = df['tick_volume'] / cols['volume_ma']
 
         # Trend indicators
-        df['uptrend'] = (df['EMA8'] > df['EMA20']) & (df['EMA20'] > df['EMA50'])
-        df['downtrend'] = (df['EMA8'] < df['EMA20']) & (df['EMA20'] < df['EMA50'])
+        cols['uptrend'] = (cols['EMA8'] > cols['EMA20']) & (cols['EMA20'] > cols['EMA50'])
+        cols['downtrend'] = (cols['EMA8'] < cols['EMA20']) & (cols['EMA20'] < cols['EMA50'])
 
         # Combined signals
-        df['strong_buy'] = (df['uptrend'] &
-                           (df['RSI'] > 50) &
-                           (df['MACD'] > df['MACD_signal']))
-        df['strong_sell'] = (df['downtrend'] &
-                            (df['RSI'] < 50) &
-                            (df['MACD'] < df['MACD_signal']))
-
-        return df
+        cols['strong_buy'] = (cols['uptrend'] &
+                             (cols['RSI'] > 50) &
+                             (cols['MACD'] > cols['MACD_signal']))
+        cols['strong_sell'] = (cols['downtrend'] &
+                              (cols['RSI'] < 50) &
+                              (cols['MACD'] < cols['MACD_signal']))
+
+        for name in FLOAT32_COLUMNS:
+            if getattr(cols[name], 'dtype', None) == np.float64:
+                cols[name] = cols[name].astype(np.float32)
+
+        # Attach every indicator column in one concat instead of growing the frame column by column
+        df = pd.concat([df.drop(columns=list(cols), errors='ignore'),
+                        pd.DataFrame(cols, index=df.index)], axis=1)
+
+        with _indicator_cache_lock:
+            _indicator_cache[key] = df
+            if len(_indicator_cache) > INDICATOR_CACHE_SIZE:
+                _indicator_cache.popitem(last=False)
+        return df.copy()
 
     except Exception as e:
         logger(f"❌ Error calculating indicators: {str(e)}")
         return df
 
 
+@lru_cache(maxsize=16)
+def _wma_kernel(period: int) -> np.ndarray:
+    """Normalized WMA weights for np.convolve (read-only, shared between calls)"""
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    weights /= weights.sum()
+    # convolve flips the kernel, so reverse it to put the largest weight on the newest bar
+    kernel = weights[::-1].copy()
+    kernel.setflags(write=False)
+    return kernel
+
+
+def wma(values: np.ndarray, period: int) -> np.ndarray:
+    """Linearly weighted moving average as one convolution; the first period-1 values are NaN"""
+    out = np.full(values.shape, np.nan)
+    if len(values) >= period:
+        out[period - 1:] = np.convolve(values, _wma_kernel(period), mode='valid')
+    return out
+
+
+def _rolling(values: np.ndarray, period: int, reducer) -> np.ndarray:
+    """Trailing-window reduction (np.mean/np.min/np.max) over a strided view; NaN until the first full window"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = reducer(sliding_window_view(values, period), axis=1)
+    return out
+
+
 def calculate_rsi(data, period=14):
     """RSI calculation with proper numpy array handling"""
     try:
-        import pandas as pd
-        import numpy as np
-
         if len(data) < period:
             return [None] * len(data)
 
@@ -121,17 +245,18 @@ def calculate_rsi(data, period=14):
         if not isinstance(data, pd.Series):
             data = pd.Series(data)
 
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        # The first delta is NaN, which counts as neither gain nor loss
+        delta = np.diff(data.to_numpy(dtype=np.float64), prepend=np.nan)
+        gain = _rolling(np.where(delta > 0, delta, 0.0), period, np.mean)
+        loss = _rolling(np.where(delta < 0, -delta, 0.0), period, np.mean)
 
         # Handle division by zero
         with np.errstate(divide='ignore', invalid='ignore'):
             rs = gain / loss
-            rs = rs.fillna(0)  # Replace NaN with 0
+        rs[np.isnan(rs)] = 0  # Replace NaN with 0
 
         rsi = 100 - (100 / (1 + rs))
-        return rsi.fillna(50)  # Replace NaN with neutral 50
+        return pd.Series(rsi, index=data.index).fillna(50)  # Replace NaN with neutral 50
 
     except Exception as e:
         logger(f"❌ RSI calculation error: {str(e)}")
@@ -141,36 +266,59 @@ def calculate_rsi(data, period=14):
 def macd_enhanced(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
     """Calculate MACD with signal line and histogram"""
     try:
-        ema_fast = series.ewm(span=fast).mean()
-        ema_slow = series.ewm(span=slow).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
-        return macd_line.fillna(0), signal_line.fillna(0), histogram.fillna(0)
+        # Recursive EMAs (adjust=False), the same definition as the EMA columns and macd_from_emas
+        ema_fast = series.ewm(span=fast, adjust=False).mean()
+        ema_slow = series.ewm(span=slow, adjust=False).mean()
+        return macd_from_emas(ema_fast, ema_slow, signal)
     except Exception as e:
         logger(f"❌ Error calculating MACD: {str(e)}")
         return pd.Series([0] * len(series)), pd.Series([0] * len(series)), pd.Series([0] * len(series))
 
 
+def macd_from_emas(ema_fast: pd.Series, ema_slow: pd.Series, signal: int = 9) -> tuple:
+    """MACD line, signal line and histogram from already computed fast/slow EMAs"""
+    macd_line = ema_fast - ema_slow
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    histogram = macd_line - signal_line
+    return macd_line.fillna(0), signal_line.fillna(0), histogram.fillna(0)
+
+
 def stochastic_enhanced(df: pd.DataFrame, k_period: int = 14, d_period: int = 3) -> tuple:
     """Calculate Stochastic oscillator"""
     try:
-        lowest_low = df['low'].rolling(window=k_period).min()
-        highest_high = df['high'].rolling(window=k_period).max()
-        k_percent = 100 * ((df['close'] - lowest_low) / (highest_high - lowest_low))
-        d_percent = k_percent.rolling(window=d_period).mean()
-        return k_percent.fillna(50), d_percent.fillna(50)
+        lowest_low = _rolling(df['low'].to_numpy(dtype=np.float64), k_period, np.min)
+        highest_high = _rolling(df['high'].to_numpy(dtype=np.float64), k_period, np.max)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_percent = 100 * ((df['close'].to_numpy(dtype=np.float64) - lowest_low) / (highest_high - lowest_low))
+        d_percent = _rolling(k_percent, d_period, np.mean)
+        return (pd.Series(k_percent, index=df.index).fillna(50),
+                pd.Series(d_percent, index=df.index).fillna(50))
     except Exception as e:
         logger(f"❌ Error calculating Stochastic: {str(e)}")
         return pd.Series([50] * len(df)), pd.Series([50] * len(df))
 
 
-def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    """Average True Range with enhanced error handling"""
-    try:
-        import pandas as pd
-        import numpy as np
+def _true_range(df: pd.DataFrame) -> np.ndarray:
+    """True range per bar; NaN parts (the first bar has no previous close) count as 0"""
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(high)
+    prev_close[0] = np.nan
+    prev_close[1:] = df['close'].to_numpy(dtype=np.float64)[:-1]
+
+    # Fold |high - prev_close| and |low - prev_close| into high - low through one reused scratch buffer
+    tr = np.nan_to_num(high - low, copy=False)
+    scratch = np.empty_like(tr)
+    for side in (high, low):
+        np.subtract(side, prev_close, out=scratch)
+        np.abs(scratch, out=scratch)
+        np.fmax(tr, np.nan_to_num(scratch, copy=False), out=tr)
+    return tr
+
 
+def atr(df: pd.DataFrame, period: int = 14, true_range: Optional[np.ndarray] = None) -> pd.Series:
+    """Average True Range with enhanced error handling; true_range may be passed in when already computed"""
+    try:
         if len(df) < period:
             return pd.Series([None] * len(df))
 
@@ -181,26 +329,15 @@ def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
                 logger(f"❌ Missing column '{col}' for ATR calculation")
                 return pd.Series([0.001] * len(df))  # Return small default ATR
 
-        high = pd.Series(df['high']).astype(float)
-        low = pd.Series(df['low']).astype(float)
-        close = pd.Series(df['close']).astype(float)
-
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-
-        # Handle NaN values
-        tr1 = tr1.fillna(0)
-        tr2 = tr2.fillna(0)
-        tr3 = tr3.fillna(0)
+        tr = _true_range(df) if true_range is None else true_range
 
-        tr = pd.DataFrame({'tr1': tr1, 'tr2': tr2, 'tr3': tr3}).max(axis=1)
-        atr_series = tr.rolling(window=period, min_periods=1).mean()
+        # Mean over up to `period` bars: the first bars average what is available so far
+        atr_values = _rolling(tr, period, np.mean)
+        head = min(period - 1, len(tr))
+        atr_values[:head] = np.cumsum(tr[:head]) / np.arange(1, head + 1)
 
         # Fill any remaining NaN with small positive values
-        atr_series = atr_series.fillna(0.001)
-
-        return atr_series
+        return pd.Series(atr_values, index=df.index).fillna(0.001)
 
     except Exception as e:
         logger(f"❌ ATR calculation error: {str(e)}")
@@ -214,17 +351,14 @@ def calculate_support_resistance(df: pd.DataFrame, window: int = 20) -> dict:
         highs = df['high'].rolling(window, center=True).max()
         lows = df['low'].rolling(window, center=True).min()
 
-        # Find resistance (local highs)
-        resistance_levels = []
-        for i in range(window, len(df) - window):
-            if df['high'].iloc[i] == highs.iloc[i]:
-                resistance_levels.append(df['high'].iloc[i])
-
-        # Find support (local lows)
-        support_levels = []
-        for i in range(window, len(df) - window):
-            if df['low'].iloc[i] == lows.iloc[i]:
-                support_levels.append(df['low'].iloc[i])
+        # Only bars with a full window on both sides are candidates
+        inner = slice(window, max(window, len(df) - window))
+        high = df['high'].to_numpy()[inner]
+        low = df['low'].to_numpy()[inner]
+
+        # Find resistance (local highs) and support (local lows) in one comparison each
+        resistance_levels = high[high == highs.to_numpy()[inner]].tolist()
+        support_levels = low[low == lows.to_numpy()[inner]].tolist()
 
         # Get most relevant levels (recent and significant)
         if resistance_levels:
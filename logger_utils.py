@@ -3,26 +3,202 @@
 Enhanced logging functionality with GUI integration
 """
 
-import datetime
+import atexit
+import gc
+import operator
 import os
-import csv
+import queue
+import sys
+import threading
+import time
 
+# Log levels; logger() discards messages below LEVEL
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL = INFO
 
-def logger(msg: str) -> None:
-    """Enhanced logging function with timestamp and GUI integration"""
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-    full_msg = f"[{timestamp}] {msg}"
-    print(full_msg)
-    
-    # Try to log to GUI if available (will be set by main module)
+# Pending log lines waiting for the writer thread; logger() drops lines beyond this
+LOG_QUEUE_SIZE = 20000
+# Most queued lines the writer thread joins into a single console write
+LOG_WRITE_BATCH = 500
+# Seconds to wait for queued lines to be written at interpreter exit
+LOG_FLUSH_TIMEOUT = 2.0
+
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_writer_thread = None
+_writer_lock = threading.Lock()
+# Bound once so the logger() hot path is a single call for the timestamp
+_now = time.time
+# GUI registered by main via set_gui(); its bound log method is cached for the writer thread
+_gui = None
+_gui_log = None
+# Lines rejected because the queue was full; reported by the writer thread
+_dropped_count = 0
+_dropped_lock = threading.Lock()
+# (second, "HH:MM:SS") of the last formatted timestamp; only touched by the writer thread
+_log_stamp = (0, "")
+
+# Order rows are buffered per CSV file and written in batches
+CSV_FIELDNAMES = ['timestamp', 'symbol', 'action', 'volume', 'price',
+                  'tp', 'sl', 'comment', 'ticket', 'profit']
+CSV_BATCH_SIZE = 1000
+CSV_FLUSH_INTERVAL = 2.0
+# O_BINARY keeps Windows from translating the \r\n line endings
+CSV_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+# Header line in the csv module's default (excel) dialect
+CSV_HEADER = ",".join(CSV_FIELDNAMES) + "\r\n"
+
+_csv_values = operator.itemgetter(*CSV_FIELDNAMES)
+# Row values of these types can be joined directly when no field needs quoting
+_CSV_PLAIN_TYPES = {str, int, float}
+
+# Defaults for rows built from the legacy positional interface
+_LEGACY_TEMPLATE = {
+    'timestamp': '', 'symbol': '', 'action': 'UNKNOWN', 'volume': 0.0, 'price': 0.0,
+    'tp': 0.0, 'sl': 0.0, 'comment': 'Legacy call', 'ticket': 0, 'profit': 0.0
+}
+
+# Set once ensure_log_directory() has succeeded so later calls skip the filesystem
+_log_dirs_ready = False
+
+_csv_buffers = {}
+_csv_lock = threading.Lock()
+# Wakes the flusher early once a buffer reaches CSV_BATCH_SIZE
+_csv_ready = threading.Condition(_csv_lock)
+# Held across swap-out and write so batches reach the files in the order they were taken
+_csv_write_lock = threading.Lock()
+# Set at exit to stop the flusher before the final drain
+_csv_stop = threading.Event()
+# Open file descriptor per CSV log, kept for the whole session; guarded by _csv_write_lock
+_csv_files = {}
+# Column names of CSV logs whose rows are value lists rather than order dicts
+_csv_fieldnames = {}
+_csv_flusher = None
+
+
+def logger(msg: str, level: int = INFO) -> None:
+    """Enhanced logging function with timestamp and GUI integration (non-blocking)"""
+    if level < LEVEL:
+        return
+    if _writer_thread is None:
+        _start_writer()
+    try:
+        _log_queue.put_nowait((_now(), msg))
+    except queue.Full:
+        # Never block the trading loop on console/GUI output
+        global _dropped_count
+        with _dropped_lock:
+            _dropped_count += 1
+
+
+def set_level(level: int) -> None:
+    """Set the minimum level logger() passes through"""
+    global LEVEL
+    LEVEL = level
+
+
+def is_enabled(level: int) -> bool:
+    """Check a level before building an expensive message, e.g. a per-tick f-string"""
+    return level >= LEVEL
+
+
+def _start_writer() -> None:
+    """Start the background log writer thread once"""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer_loop, name="LogWriter", daemon=True)
+            _writer_thread.start()
+
+
+def _writer_loop() -> None:
+    """Write queued log lines to the console in batches and forward them to the GUI"""
+    while True:
+        batch = [_log_queue.get()]
+        while len(batch) < LOG_WRITE_BATCH:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        items = [item for item in batch if item is not None]
+        dropped = _take_dropped_count()
+        if dropped:
+            items.append((time.time(), f"⚠️ {dropped} log messages dropped (queue full)"))
+        try:
+            _write_console("".join(f"[{_format_stamp(stamp)}] {msg}\n" for stamp, msg in items))
+            for _, msg in items:
+                _forward_to_gui(msg)
+        finally:
+            for _ in batch:
+                _log_queue.task_done()
+        if None in batch:
+            return
+
+
+def _take_dropped_count() -> int:
+    """Return and reset the number of dropped log lines"""
+    global _dropped_count
+    if not _dropped_count:
+        return 0
+    with _dropped_lock:
+        dropped, _dropped_count = _dropped_count, 0
+    return dropped
+
+
+def _write_console(text: str) -> None:
+    """Write a block of log lines to stdout with one write and one flush"""
+    if not text:
+        return
+    try:
+        out = sys.stdout
+        try:
+            out.write(text)
+        except UnicodeEncodeError:
+            # Console code page without emoji support
+            encoding = out.encoding or 'ascii'
+            out.write(text.encode(encoding, 'replace').decode(encoding))
+        out.flush()
+    except (OSError, ValueError, AttributeError):
+        # stdout closed or missing (e.g. pythonw)
+        pass
+
+
+def _format_stamp(stamp: float) -> str:
+    """Format a log timestamp, reusing the string while the second is unchanged"""
+    global _log_stamp
+    second = int(stamp)
+    if second != _log_stamp[0]:
+        _log_stamp = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+    return _log_stamp[1]
+
+
+def set_gui(gui) -> None:
+    """Register the GUI that receives log messages"""
+    global _gui, _gui_log
+    _gui = gui
+    _gui_log = gui.log
+
+
+def clear_gui() -> None:
+    """Stop forwarding log messages to the GUI"""
+    global _gui, _gui_log
+    _gui_log = None
+    _gui = None
+
+
+def _forward_to_gui(msg: str) -> None:
+    """Pass a message to the GUI log if one is registered"""
+    gui, gui_log = _gui, _gui_log
+    if gui_log is None:
+        return
     try:
-        import __main__
-        if hasattr(__main__, 'gui') and __main__.gui:
-            # Check if GUI is in shutdown process
-            if hasattr(__main__.gui, '_shutdown_in_progress') and __main__.gui._shutdown_in_progress:
-                return  # Skip GUI logging during shutdown
-            __main__.gui.log(msg)  # Pass message without timestamp since GUI adds its own
-    except (ImportError, AttributeError, TypeError):
+        # Check if GUI is in shutdown process
+        if getattr(gui, '_shutdown_in_progress', False):
+            return  # Skip GUI logging during shutdown
+        gui_log(msg)  # Pass message without timestamp since GUI adds its own
+    except (AttributeError, TypeError):
         # GUI not available or in invalid state
         pass
     except Exception as e:
@@ -30,20 +206,40 @@ def logger(msg: str) -> None:
         pass
 
 
+def flush_logs(timeout: float = LOG_FLUSH_TIMEOUT) -> None:
+    """Stop the writer thread after it has written every queued line"""
+    global _writer_thread
+    thread = _writer_thread
+    if thread is None or not thread.is_alive():
+        return
+    try:
+        _log_queue.put(None, timeout=timeout)
+    except queue.Full:
+        return
+    thread.join(timeout)
+    if not thread.is_alive():
+        _writer_thread = None
+
+
+atexit.register(flush_logs)
+
+
 def ensure_log_directory() -> bool:
     """Ensure log directory exists with proper error handling"""
+    global _log_dirs_ready
+    if _log_dirs_ready:
+        return True
     try:
-        log_dir = "logs"
-        csv_dir = "csv_logs"
-        
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-            logger(f"📁 Created log directory: {log_dir}")
-            
-        if not os.path.exists(csv_dir):
-            os.makedirs(csv_dir, exist_ok=True)
-            logger(f"📁 Created CSV log directory: {csv_dir}")
+        # A bare mkdir is one syscall and still tells us whether the directory was new
+        for path, label in (("logs", "log directory"), ("csv_logs", "CSV log directory")):
+            try:
+                os.mkdir(path)
+                logger(f"📁 Created {label}: {path}")
+            except FileExistsError:
+                if not os.path.isdir(path):
+                    raise
             
+        _log_dirs_ready = True
         return True
     except Exception as e:
         logger(f"❌ Error creating log directories: {str(e)}")
@@ -52,53 +248,188 @@ def ensure_log_directory() -> bool:
 
 def log_order_csv(filename: str, order: dict, symbol: str = None, action: str = None, 
                   volume: float = None, price: float = None, comment: str = None) -> None:
-    """Log order to CSV file with proper error handling - supports both dict and individual parameters"""
+    """Queue an order row for the CSV file - supports both dict and individual parameters"""
     try:
-        ensure_log_directory()
-        filepath = os.path.join("csv_logs", filename)
-        
-        # Check if file exists to determine if header needed
-        file_exists = os.path.exists(filepath)
-        
         # Handle both dict and individual parameter calls
         if isinstance(order, dict):
             order_data = order
         else:
             # Legacy compatibility - construct dict from individual parameters
-            order_data = {
-                'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'symbol': symbol or order,  # order is actually symbol in legacy calls
-                'action': action or 'UNKNOWN',
-                'volume': volume or 0.0,
-                'price': price or 0.0,
-                'tp': 0.0,
-                'sl': 0.0,
-                'comment': comment or 'Legacy call',
-                'ticket': 0,
-                'profit': 0.0
-            }
+            order_data = _LEGACY_TEMPLATE.copy()
+            order_data['timestamp'] = time.strftime("%Y-%m-%d %H:%M:%S")
+            order_data['symbol'] = symbol or order  # order is actually symbol in legacy calls
+            if action:
+                order_data['action'] = action
+            if volume:
+                order_data['volume'] = volume
+            if price:
+                order_data['price'] = price
+            if comment:
+                order_data['comment'] = comment
+
+        queue_csv_row(filename, order_data)
+        logger(f"📝 Order logged to {filename}")
+        
+    except Exception as e:
+        logger(f"❌ Error logging to CSV {filename}: {str(e)}")
+
+
+def queue_csv_row(filename: str, row, fieldnames: list = None) -> None:
+    """Queue a row (order dict or value list) for csv_logs/filename; fieldnames is the header for value rows"""
+    if _csv_flusher is None:
+        _start_csv_flusher()
+
+    # The flusher swaps the list out before writing, so callers never wait on disk I/O
+    with _csv_lock:
+        if fieldnames is not None:
+            _csv_fieldnames[filename] = fieldnames
+        rows = _csv_buffers.setdefault(filename, [])
+        rows.append(row)
+        if len(rows) >= CSV_BATCH_SIZE:
+            _csv_ready.notify()
+
+
+def _csv_field(value) -> str:
+    """Format one CSV field exactly like csv.writer with minimal quoting"""
+    if value is None:
+        return ''
+    text = value if isinstance(value, str) else str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _encode_csv_row(row) -> str:
+    """Encode one row: a dict in CSV_FIELDNAMES order (missing keys become empty fields) or a sequence of values"""
+    if isinstance(row, dict):
+        try:
+            values = _csv_values(row)
+        except KeyError:
+            values = [row.get(name) for name in CSV_FIELDNAMES]
+    else:
+        values = row
+    if _CSV_PLAIN_TYPES.issuperset(map(type, values)):
+        line = ",".join(map(str, values))
+        # Only the field separators may appear, otherwise quoting is needed
+        if (line.count(',') == len(values) - 1 and '"' not in line
+                and '\n' not in line and '\r' not in line):
+            return line + "\r\n"
+    return ",".join([_csv_field(value) for value in values]) + "\r\n"
+
+
+def _encode_csv_rows(batch: list) -> str:
+    """Encode a batch of rows as one string"""
+    return "".join([_encode_csv_row(row) for row in batch])
+
+
+def _csv_fd(filename: str) -> int:
+    """Return the open file descriptor for a CSV log, opening it on first use"""
+    fd = _csv_files.get(filename)
+    if fd is None:
+        ensure_log_directory()
+        fd = os.open(os.path.join("csv_logs", filename), CSV_OPEN_FLAGS, 0o644)
         
-        with open(filepath, 'a', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['timestamp', 'symbol', 'action', 'volume', 'price', 
-                         'tp', 'sl', 'comment', 'ticket', 'profit']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        # Header only for a new or empty file
+        if os.fstat(fd).st_size == 0:
+            fieldnames = _csv_fieldnames.get(filename)
+            header = CSV_HEADER if fieldnames is None else _encode_csv_row(fieldnames)
+            _write_fd(fd, header.encode('utf-8'))
             
-            if not file_exists:
-                writer.writeheader()
-                
-            writer.writerow(order_data)
+        _csv_files[filename] = fd
+    return fd
+
+
+def _write_fd(fd: int, data: bytes) -> None:
+    """Write all of data, retrying after partial writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _close_csv_file(filename: str) -> None:
+    """Close and forget an open CSV log"""
+    fd = _csv_files.pop(filename, None)
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _write_csv_batch(filename: str, batch: list) -> None:
+    """Append a batch of order rows to its CSV log with a single write"""
+    try:
+        _write_fd(_csv_fd(filename), _encode_csv_rows(batch).encode('utf-8'))
             
-        logger(f"📝 Order logged to {filename}")
-        
     except Exception as e:
+        _close_csv_file(filename)  # Reopen on the next batch
         logger(f"❌ Error logging to CSV {filename}: {str(e)}")
 
 
-def cleanup_resources() -> None:
-    """Cleanup utility to manage memory usage and resource leaks"""
+def flush_all_csv() -> None:
+    """Write every buffered order row to its CSV file"""
+    with _csv_write_lock:
+        with _csv_lock:
+            pending = [(name, rows) for name, rows in _csv_buffers.items() if rows]
+            _csv_buffers.clear()
+        for filename, batch in pending:
+            _write_csv_batch(filename, batch)
+
+
+def _start_csv_flusher() -> None:
+    """Start the periodic CSV flush thread once"""
+    global _csv_flusher
+    with _csv_lock:
+        if _csv_flusher is None:
+            _csv_flusher = threading.Thread(target=_csv_flush_loop, name="CsvFlusher", daemon=True)
+            _csv_flusher.start()
+
+
+def _csv_flush_loop() -> None:
+    """Flush buffered order rows when a batch fills or every CSV_FLUSH_INTERVAL seconds"""
+    while not _csv_stop.is_set():
+        with _csv_ready:
+            if not _csv_stop.is_set():
+                _csv_ready.wait(CSV_FLUSH_INTERVAL)
+        flush_all_csv()
+
+
+def _stop_csv_flusher() -> None:
+    """Stop the flush thread and wait for its last batch to be written"""
+    thread = _csv_flusher
+    if thread is None:
+        return
+    with _csv_ready:
+        _csv_stop.set()
+        _csv_ready.notify_all()
+    thread.join(LOG_FLUSH_TIMEOUT)
+
+
+def sync_csv_files(close: bool = False) -> None:
+    """Write buffered rows and fsync every open CSV log; close=True also stops the flusher and closes them"""
+    if close:
+        _stop_csv_flusher()
+    flush_all_csv()
+    with _csv_write_lock:
+        for filename in list(_csv_files):
+            try:
+                os.fsync(_csv_files[filename])
+            except OSError as e:
+                logger(f"❌ Error syncing CSV {filename}: {str(e)}")
+            if close:
+                _close_csv_file(filename)
+
+
+# atexit runs handlers in reverse order: CSV rows are written before the log queue is drained
+atexit.register(sync_csv_files, close=True)
+
+
+def cleanup_resources(full: bool = False) -> None:
+    """Cleanup utility to manage memory usage; full=True also syncs CSV logs and scans the oldest generation"""
     try:
-        import gc
-        gc.collect()
-        logger("🧹 Memory cleanup completed")
+        if full:
+            sync_csv_files()
+        gc.collect(2 if full else 1)
+        logger("🧹 Memory cleanup completed", INFO if full else DEBUG)
     except Exception as e:
         logger(f"❌ Error during cleanup: {str(e)}")
\ No newline at end of file
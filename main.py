@@ -9,10 +9,11 @@ import sys
 import tkinter as tk
 from tkinter import messagebox
 import datetime
+import gc
 import threading
 
 # Import our modular components
-from logger_utils import logger, ensure_log_directory
+from logger_utils import logger, ensure_log_directory, cleanup_resources, set_gui, clear_gui
 from config import STRATEGIES
 from gui_module import TradingBotGUI
 from bot_controller import start_bot_thread, stop_bot, start_auto_recovery_monitor, get_bot_status, emergency_stop_all
@@ -21,6 +22,9 @@ from bot_controller import start_bot_thread, stop_bot, start_auto_recovery_monit
 gui = None
 bot_running = False
 
+# Bound once for the console timestamps printed while the GUI log is shutting down
+_now = datetime.datetime.now
+
 
 def initialize_application():
     """Initialize the application and all required components"""
@@ -42,6 +46,9 @@ def initialize_application():
             logger("❌ Error: Python 3.8 or higher required")
             return False
         
+        # Move import-time objects out of the collector's reach for the rest of the session
+        gc.freeze()
+        
         logger("✅ Application initialized successfully")
         return True
         
@@ -71,6 +78,7 @@ def create_main_window():
         # Create GUI instance
         global gui
         gui = TradingBotGUI(root)
+        set_gui(gui)
         
         # Set global GUI reference for other modules
         # Note: In Replit environment, we handle global state through module imports
@@ -91,7 +99,7 @@ def create_main_window():
 def on_application_closing():
     """Handle application closing event"""
     try:
-        print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] 🔄 Application shutdown initiated...")
+        print(f"[{_now().strftime('%H:%M:%S')}] 🔄 Application shutdown initiated...")
         
         # Ask user confirmation if bot is running
         global bot_running
@@ -111,9 +119,13 @@ def on_application_closing():
         # Stop bot and cleanup
         stop_bot()
         
-        # Mark GUI as shutting down
+        # Mark GUI as shutting down and stop its update loops
         if gui:
-            gui._shutdown_in_progress = True
+            gui.stop_background_work()
+        clear_gui()
+        
+        # Full collection only here; periodic cleanups stay on the young generations
+        cleanup_resources(full=True)
         
         # Close GUI
         if gui and hasattr(gui, 'root') and gui.root:
@@ -126,10 +138,10 @@ def on_application_closing():
             except:
                 pass
         
-        print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ✅ Application shutdown completed")
+        print(f"[{_now().strftime('%H:%M:%S')}] ✅ Application shutdown completed")
         
     except Exception as e:
-        print(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ❌ Error during application shutdown: {str(e)}")
+        print(f"[{_now().strftime('%H:%M:%S')}] ❌ Error during application shutdown: {str(e)}")
         # Force exit if normal shutdown fails
         try:
             if gui and hasattr(gui, 'root') and gui.root:
@@ -3,7 +3,9 @@
 Risk management, position sizing, and trade limits - REAL ACCOUNT PROTECTION
 """
 
+import __main__
 import datetime
+import traceback
 from typing import Dict, Any, Tuple, Optional
 from logger_utils import logger
 from config import MAX_RISK_PERCENTAGE, MAX_DAILY_TRADES, MAX_OPEN_POSITIONS, DEFAULT_MAX_ORDERS, MIN_MAX_ORDERS, MAX_MAX_ORDERS
@@ -131,7 +133,6 @@ def check_order_limit() -> bool:
             # Get current order count from GUI
             current_orders = 0
             try:
-                import __main__
                 if hasattr(__main__, 'gui') and __main__.gui:
                     current_orders = __main__.gui.order_count
             except:
@@ -189,7 +190,6 @@ def reset_order_count() -> None:
     try:
         # Update GUI order count
         try:
-            import __main__
             if hasattr(__main__, 'gui') and __main__.gui:
                 __main__.gui.order_count = 0
                 __main__.gui.update_order_count_display()
@@ -211,7 +211,6 @@ def check_order_limit() -> bool:
             # Get current order count from GUI
             current_orders = 0
             try:
-                import __main__
                 if hasattr(__main__, 'gui') and __main__.gui:
                     current_orders = __main__.gui.order_count
             except:
@@ -269,7 +268,6 @@ def reset_order_count() -> None:
     try:
         # Update GUI order count
         try:
-            import __main__
             if hasattr(__main__, 'gui') and __main__.gui:
                 __main__.gui.order_count = 0
                 __main__.gui.update_order_count_display()
@@ -379,7 +377,6 @@ def increment_daily_trade_count() -> None:
 def safe_update_gui_count():
     """Safely update GUI count on main thread"""
     try:
-        import __main__
         if hasattr(__main__, 'gui') and __main__.gui:
             if not hasattr(__main__.gui, 'order_count'):
                 __main__.gui.order_count = 0
@@ -501,7 +498,6 @@ def get_current_risk_metrics() -> Dict[str, Any]:
 
     except Exception as e:
         logger(f"❌ Error getting risk metrics: {str(e)}")
-        import traceback
         logger(f"📝 Risk metrics traceback: {traceback.format_exc()}")
         return {
             'error': str(e),
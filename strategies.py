@@ -3,6 +3,8 @@
 All trading strategies: Scalping, Intraday, Arbitrage, HFT
 """
 
+import time
+import traceback
 import pandas as pd
 import numpy as np
 from typing import Optional, List, Tuple
@@ -138,7 +140,6 @@ def run_strategy(strategy: str, df: pd.DataFrame, symbol: str) -> Tuple[Optional
                     break
             else:
                 logger(f"⚠️ Tick attempt {tick_attempt + 1}: No valid tick for {symbol}")
-                import time
                 time.sleep(0.5)
 
         if not current_tick or not hasattr(current_tick, 'bid') or current_tick.bid <= 0:
@@ -268,7 +269,6 @@ def run_strategy(strategy: str, df: pd.DataFrame, symbol: str) -> Tuple[Optional
 
     except Exception as e:
         logger(f"❌ Error in run_strategy: {str(e)}")
-        import traceback
         logger(f"📝 Traceback: {traceback.format_exc()}")
         return None, [f"Strategy error: {str(e)}"]
 
@@ -0,0 +1,135 @@
+# --- Config Manager Persistence Test ---
+"""
+Verify config saves are atomic, coalesced on one writer thread, and skipped when nothing changed
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import json
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Fresh ConfigManager on a config file inside a temporary directory"""
+    # Importing config_manager creates its global instance in the cwd, so import from the temp dir
+    monkeypatch.chdir(tmp_path)
+    from config_manager import ConfigManager
+    return ConfigManager(str(tmp_path / "test_config.json"))
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _wait_for_writer(manager):
+    """Join the background save thread if one is running"""
+    writer = manager._writer
+    if writer is not None:
+        writer.join(5)
+
+
+def test_async_saves_land_latest_value(manager):
+    """Auto-saved settings reach the file, the last set() winning"""
+    for value in range(1, 30):
+        assert manager.set('max_orders', value)
+    _wait_for_writer(manager)
+
+    assert _read(manager.config_file)['max_orders'] == 29
+    assert manager._writer is None
+    assert not os.path.exists(f"{manager.config_file}.tmp")
+
+
+def test_async_saves_use_one_non_daemon_writer(manager, monkeypatch):
+    """Requests made while a save runs coalesce on the same non-daemon thread"""
+    started, release = threading.Event(), threading.Event()
+    original = manager.save_config
+    calls = []
+
+    def slow_save():
+        calls.append(threading.current_thread())
+        started.set()
+        release.wait(5)
+        return original()
+
+    monkeypatch.setattr(manager, 'save_config', slow_save)
+    manager.set('max_orders', 5)
+    assert started.wait(5)
+    writer = manager._writer
+    assert writer is not None and not writer.daemon
+    for value in (6, 7, 8):
+        manager.set('max_orders', value)
+    assert manager._writer is writer
+    release.set()
+    _wait_for_writer(manager)
+
+    assert len(calls) == 2  # The first request, then one pass for everything queued behind it
+    assert _read(manager.config_file)['max_orders'] == 8
+
+
+def test_interrupted_write_keeps_previous_file(manager, monkeypatch):
+    """A failure while writing the new text leaves the old config intact"""
+    manager.config['max_orders'] = 11
+    assert manager.save_config()
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, 'replace', broken_replace)
+    manager.config['max_orders'] = 12
+    assert not manager.save_config()
+    assert _read(manager.config_file)['max_orders'] == 11
+
+
+def _age(path, seconds=100):
+    """Move a file's mtime into the past so a rewrite is detectable"""
+    stamp = os.path.getmtime(path) - seconds
+    os.utime(path, (stamp, stamp))
+    return stamp
+
+
+def test_unchanged_settings_are_not_rewritten(manager):
+    """save_config skips the write when the serialized text matches the last save"""
+    path = manager.config_file
+    assert os.path.exists(path)
+    stamp = _age(path)
+
+    assert manager.save_config()
+    assert os.path.getmtime(path) == stamp
+
+    manager.config['max_orders'] = 12
+    assert manager.save_config()
+    assert os.path.getmtime(path) != stamp
+    assert _read(path)['max_orders'] == 12
+
+
+def test_deleted_file_is_written_again(manager):
+    """An unchanged config is still saved when the file has disappeared"""
+    os.remove(manager.config_file)
+    assert manager.save_config()
+    assert _read(manager.config_file)['max_orders'] == manager.config['max_orders']
+
+
+def test_load_skips_unchanged_file(manager):
+    """load_config keeps the in-memory settings while the file's mtime is unchanged"""
+    manager.config['max_orders'] = 33  # Not saved: a re-parse would reset it
+    assert manager.load_config()
+    assert manager.config['max_orders'] == 33
+
+
+def test_load_rereads_modified_file(manager):
+    """A file edited outside the bot (new mtime) is parsed again"""
+    path = manager.config_file
+    data = _read(path)
+    data['max_orders'] = 7
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    _age(path, seconds=5)  # Guarantee a different mtime on coarse filesystem clocks
+
+    assert manager.load_config()
+    assert manager.config['max_orders'] == 7
@@ -0,0 +1,260 @@
+# --- Technical Indicators Test ---
+"""
+Verify indicator results, the indicator result cache and incremental EMA reuse
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+import indicators
+from indicators import calculate_indicators
+
+
+def _bars(n=300, seed=7, start="2025-01-01", base=2000.0):
+    """Synthetic M1 OHLC bars shaped like an MT5 rates frame"""
+    rng = np.random.default_rng(seed)
+    close = base + np.cumsum(rng.normal(0, 1.5, n))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = rng.uniform(0.1, 2.0, n)
+    return pd.DataFrame({
+        'time': pd.date_range(start, periods=n, freq="1min"),
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'tick_volume': rng.integers(50, 500, n),
+    })
+
+
+def _clear_caches():
+    """Start each test from empty indicator and EMA caches"""
+    indicators._indicator_cache.clear()
+    indicators._ema_state.clear()
+
+
+def test_cache_separates_frames_with_same_edges():
+    """Frames that differ only inside the window must not share cached indicators"""
+    _clear_caches()
+    first = _bars()
+    second = first.copy()
+    second.loc[150, 'close'] += 25.0  # Same length, first/last bar and last prices
+
+    a = calculate_indicators(first)
+    b = calculate_indicators(second)
+    assert a['WMA8'].iat[151] != b['WMA8'].iat[151]
+    assert a['BB_middle'].iat[160] != b['BB_middle'].iat[160]
+    assert calculate_indicators(first)['WMA8'].iat[151] == a['WMA8'].iat[151]
+
+
+def test_cached_result_is_not_shared():
+    """Mutating a returned frame leaves later results intact"""
+    _clear_caches()
+    df = _bars()
+    result = calculate_indicators(df)
+    expected = result['RSI'].iat[-1]
+    result['RSI'] = 0.0
+    result.drop(columns=['EMA8'], inplace=True)
+
+    again = calculate_indicators(df)
+    assert again is not result
+    assert again['RSI'].iat[-1] == expected
+    assert 'EMA8' in again.columns
+
+
+def _reference_ema(close, span):
+    """Full pandas EMA used as the reference for the incremental path"""
+    return pd.Series(close).ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def test_incremental_ema_matches_full_recompute():
+    """Growing, shifted and revised windows give the same EMAs as a full ewm pass"""
+    _clear_caches()
+    bars = _bars(400)
+    close = bars['close'].to_numpy(dtype=np.float64)
+    frame_id = ('frame', close[0])
+
+    windows = [
+        close[:300],                               # initial frame
+        np.append(close[:299], close[299] + 0.7),  # forming bar updated
+        close[:301],                               # one new bar
+        close[:320],                               # several new bars
+    ]
+    revised = close[:321].copy()
+    revised[100] += 5.0                            # an earlier bar revised
+    windows.append(revised)
+    windows.append(close[:250])                    # shorter window
+    shifted = close[1:330].copy()
+    shifted[0] = close[0]                          # rebased window that keeps the same frame id
+    windows.append(shifted)
+
+    for window in windows:
+        emas = indicators._incremental_emas(window, frame_id)
+        for span in indicators.EMA_SPANS:
+            np.testing.assert_allclose(emas[span], _reference_ema(window, span), rtol=1e-12, atol=1e-9)
+
+
+def test_revised_bar_changes_cached_emas():
+    """A frame differing only inside the window gets its own EMAs"""
+    _clear_caches()
+    first = _bars()
+    second = first.copy()
+    second.loc[150, 'close'] += 25.0
+
+    a = calculate_indicators(first)
+    b = calculate_indicators(second)
+    np.testing.assert_allclose(b['EMA20'].to_numpy(), _reference_ema(second['close'].to_numpy(), 20))
+    assert a['EMA20'].iat[151] != b['EMA20'].iat[151]
+
+
+def _bars_with_flat_stretch():
+    """Bars including a flat stretch, where RSI and Stochastic divide by zero"""
+    df = _bars(260, seed=11)
+    df.loc[120:150, ['open', 'high', 'low', 'close']] = 2000.0
+    return df
+
+
+def _assert_close(actual, expected, rtol=1e-9, atol=1e-9):
+    np.testing.assert_allclose(np.asarray(actual, dtype=np.float64), np.asarray(expected, dtype=np.float64),
+                               rtol=rtol, atol=atol)
+
+
+def _reference_wma(close, period):
+    weights = np.arange(1, period + 1)
+    return close.rolling(period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
+
+
+def test_wma_matches_rolling_apply():
+    """Convolution WMAs equal the rolling().apply dot-product formulation"""
+    _clear_caches()
+    df = _bars()
+    result = calculate_indicators(df.copy())
+    for period in (8, 14, 21):
+        _assert_close(result[f'WMA{period}'], _reference_wma(df['close'], period))
+    _assert_close(indicators.wma(df['close'].to_numpy()[:5], 8), [np.nan] * 5)
+
+
+def _reference_rsi(close, period):
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = (gain / loss).fillna(0)
+    return (100 - (100 / (1 + rs))).fillna(50)
+
+
+def _reference_stochastic(df, k_period=14, d_period=3):
+    lowest_low = df['low'].rolling(window=k_period).min()
+    highest_high = df['high'].rolling(window=k_period).max()
+    k_percent = 100 * ((df['close'] - lowest_low) / (highest_high - lowest_low))
+    return k_percent.fillna(50), k_percent.rolling(window=d_period).mean().fillna(50)
+
+
+def _reference_atr(df, period):
+    prev_close = df['close'].shift(1)
+    tr = pd.DataFrame({
+        'tr1': (df['high'] - df['low']).fillna(0),
+        'tr2': (df['high'] - prev_close).abs().fillna(0),
+        'tr3': (df['low'] - prev_close).abs().fillna(0),
+    }).max(axis=1)
+    return tr.rolling(window=period, min_periods=1).mean().fillna(0.001)
+
+
+def test_numpy_oscillators_match_pandas_reference():
+    """RSI, Stochastic and ATR on numpy arrays equal the pandas rolling versions, flat stretches included"""
+    for df in (_bars(), _bars_with_flat_stretch()):
+        for period in (7, 14, 21):
+            _assert_close(indicators.calculate_rsi(df['close'], period), _reference_rsi(df['close'], period))
+        k, d = indicators.stochastic_enhanced(df)
+        k_ref, d_ref = _reference_stochastic(df)
+        _assert_close(k, k_ref)
+        _assert_close(d, d_ref)
+        for period in (7, 14):
+            _assert_close(indicators.atr(df, period), _reference_atr(df, period))
+
+
+def test_support_resistance_levels():
+    """Mask-based support/resistance equals a direct scan for local extremes"""
+    df = _bars(200, seed=3)
+    window = 20
+    highs = df['high'].rolling(window, center=True).max()
+    lows = df['low'].rolling(window, center=True).min()
+    resistance = [df['high'].iloc[i] for i in range(window, len(df) - window) if df['high'].iloc[i] == highs.iloc[i]]
+    support = [df['low'].iloc[i] for i in range(window, len(df) - window) if df['low'].iloc[i] == lows.iloc[i]]
+
+    levels = indicators.calculate_support_resistance(df, window)
+    assert levels['resistance'] == sorted(resistance[-10:])[-3:]
+    assert levels['support'] == sorted(support[-10:])[:3]
+    assert levels['current_price'] == df['close'].iloc[-1]
+
+
+def _reference_macd(close, fast=12, slow=26, signal=9):
+    macd_line = close.ewm(span=fast, adjust=False).mean() - close.ewm(span=slow, adjust=False).mean()
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def test_macd_columns_from_ema_columns():
+    """MACD columns built from EMA12/EMA26 equal recursive (adjust=False) pandas EWMs"""
+    _clear_caches()
+    df = _bars()
+    result = calculate_indicators(df.copy())
+    macd_ref, signal_ref, hist_ref = _reference_macd(df['close'])
+    _assert_close(result['MACD'], macd_ref)
+    _assert_close(result['MACD_signal'], signal_ref)
+    _assert_close(result['MACD_histogram'], hist_ref)
+    _assert_close(result['MACD'], result['EMA12'] - result['EMA26'])
+
+
+def test_macd_enhanced_matches_indicator_columns():
+    """The standalone macd_enhanced helper returns the same series as calculate_indicators"""
+    _clear_caches()
+    df = _bars_with_flat_stretch()
+    result = calculate_indicators(df.copy())
+    for actual, expected, column in zip(indicators.macd_enhanced(df['close']), _reference_macd(df['close']),
+                                        ('MACD', 'MACD_signal', 'MACD_histogram')):
+        _assert_close(actual, expected)
+        _assert_close(actual, result[column])
+
+
+def test_atr_columns_share_one_true_range():
+    """ATR/ATR_fast from the shared true-range pass equal the per-period pandas versions"""
+    _clear_caches()
+    df = _bars_with_flat_stretch()
+    result = calculate_indicators(df.copy())
+    _assert_close(result['ATR'], _reference_atr(df, 14))
+    _assert_close(result['ATR_fast'], _reference_atr(df, 7))
+    tr = indicators._true_range(df)
+    _assert_close(indicators.atr(df, 14, true_range=tr), indicators.atr(df, 14))
+
+
+def test_oscillator_columns_are_float32():
+    """RSI and Stochastic columns are float32 and stay within 1e-4 of the float64 reference"""
+    _clear_caches()
+    df = _bars()
+    result = calculate_indicators(df.copy())
+    for column in indicators.FLOAT32_COLUMNS:
+        assert result[column].dtype == np.float32
+    for column, period in (('RSI', 14), ('RSI_fast', 7), ('RSI_slow', 21)):
+        _assert_close(result[column], _reference_rsi(df['close'], period), rtol=0, atol=1e-4)
+    k_ref, d_ref = _reference_stochastic(df)
+    _assert_close(result['%K'], k_ref, rtol=0, atol=1e-4)
+    _assert_close(result['%D'], d_ref, rtol=0, atol=1e-4)
+    assert result['EMA20'].dtype == np.float64 and result['ATR'].dtype == np.float64
+
+
+def test_recomputing_indicators_replaces_columns():
+    """Running calculate_indicators on a frame that already has the columns yields no duplicates"""
+    _clear_caches()
+    df = _bars()
+    first = calculate_indicators(df.copy())
+    _clear_caches()
+    second = calculate_indicators(first.copy())
+    assert not second.columns.duplicated().any()
+    assert list(second.columns) == list(first.columns)
+    for column in ('EMA20', 'WMA14', 'BB_upper', 'BB_middle', 'MACD'):
+        _assert_close(second[column], first[column])
+    assert second.index.equals(df.index)
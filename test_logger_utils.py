@@ -0,0 +1,197 @@
+# --- Logging Utilities Test ---
+"""
+Verify batched order CSV logging keeps rows complete and in order
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import threading
+
+import pytest
+
+import logger_utils
+from logger_utils import log_order_csv, flush_all_csv, sync_csv_files
+
+
+@pytest.fixture
+def csv_dir(tmp_path, monkeypatch):
+    """Run in a temporary directory with fresh CSV logging state"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logger_utils, '_log_dirs_ready', False)
+    yield tmp_path / "csv_logs"
+    sync_csv_files(close=True)
+    logger_utils._csv_stop.clear()
+    logger_utils._csv_flusher = None
+
+
+def _order(ticket, **fields):
+    """Order row with every CSV field set"""
+    row = {'timestamp': '2025-01-01 10:00:00', 'symbol': 'XAUUSD', 'action': 'BUY', 'volume': 0.01,
+           'price': 2000.5, 'tp': 2010.0, 'sl': 1995.0, 'comment': 'test', 'ticket': ticket, 'profit': 0.0}
+    row.update(fields)
+    return row
+
+
+def test_rows_stay_in_order_with_concurrent_flushes(csv_dir):
+    """Rows written while several threads flush land in the file in submission order"""
+    stop = threading.Event()
+
+    def keep_flushing():
+        while not stop.is_set():
+            flush_all_csv()
+
+    flushers = [threading.Thread(target=keep_flushing) for _ in range(3)]
+    for thread in flushers:
+        thread.start()
+    for ticket in range(2000):
+        log_order_csv("orders.csv", _order(ticket))
+    stop.set()
+    for thread in flushers:
+        thread.join()
+    sync_csv_files(close=True)
+
+    lines = (csv_dir / "orders.csv").read_text(encoding='utf-8').splitlines()
+    assert lines[0] == ",".join(logger_utils.CSV_FIELDNAMES)
+    assert [int(line.split(",")[8]) for line in lines[1:]] == list(range(2000))
+    assert not logger_utils._csv_flusher.is_alive()
+
+
+def test_legacy_call_builds_full_row(csv_dir):
+    """Positional legacy calls fill the template defaults"""
+    log_order_csv("legacy.csv", "XAUUSD", action="SELL", volume=0.5)
+    sync_csv_files(close=True)
+
+    header, line = (csv_dir / "legacy.csv").read_text(encoding='utf-8').splitlines()
+    fields = dict(zip(header.split(","), line.split(",")))
+    assert fields['symbol'] == 'XAUUSD'
+    assert fields['action'] == 'SELL'
+    assert fields['volume'] == '0.5'
+    assert fields['comment'] == 'Legacy call'
+
+
+def test_csv_round_trip_with_special_characters(csv_dir):
+    """Rows written by the str.join encoder read back unchanged through the csv module"""
+    import csv
+
+    tricky = [
+        _order(1, comment='plain'),
+        _order(2, comment='comma, inside'),
+        _order(3, comment='say "hi"'),
+        _order(4, comment='line one\nline two'),
+        _order(5, comment='carriage\rreturn', symbol='EUR,USD'),
+        _order(6, comment='"', action=''),
+        _order(7, comment='émoji 🚀, "both"\r\n'),
+    ]
+    for row in tricky:
+        log_order_csv("orders.csv", row)
+    log_order_csv("orders.csv", {'symbol': 'GBPUSD', 'ticket': 8})  # Missing fields become empty
+    sync_csv_files(close=True)
+
+    with open(csv_dir / "orders.csv", newline='', encoding='utf-8') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+
+    expected = tricky + [{'symbol': 'GBPUSD', 'ticket': 8}]
+    assert len(rows) == len(expected)
+    for row, sent in zip(rows, expected):
+        assert row == {name: '' if sent.get(name) is None else str(sent[name])
+                       for name in logger_utils.CSV_FIELDNAMES}
+
+
+def test_encoder_matches_csv_dictwriter():
+    """The custom encoder is byte-identical to csv.DictWriter for the same rows"""
+    import csv
+    import io
+
+    rows = [_order(1), _order(2, comment='a,b "c"\n'), _order(3, volume=None, price=1e-07, comment=' lead'),
+            {'ticket': 4, 'comment': '\r'}]
+    out = io.StringIO(newline='')
+    writer = csv.DictWriter(out, fieldnames=logger_utils.CSV_FIELDNAMES)
+    writer.writeheader()
+    writer.writerows(rows)
+    assert logger_utils.CSV_HEADER + logger_utils._encode_csv_rows(rows) == out.getvalue()
+
+
+
+def test_encoder_matches_csv_writer_for_value_rows():
+    """Sequence rows encode byte-identically to csv.writer"""
+    import csv
+    import io
+
+    rows = [['2025-01-01 10:00:00', 'XAUUSD', 'BUY', 0.01, 2000.5, 0, 0, 123, 456, 10009, 'Request executed'],
+            ['2025-01-01 10:00:01', 'EURUSD', 'SELL', 1, None, True, 1e-07, 0, 0, 10004, 'Requote, "retry"\n']]
+    out = io.StringIO(newline='')
+    csv.writer(out).writerows(rows)
+    assert logger_utils._encode_csv_rows(rows) == out.getvalue()
+
+
+def test_trading_operations_orders_use_batched_writer(csv_dir):
+    """Live order logging writes the orders.csv header once and the rows in csv.writer format"""
+    import csv
+    from types import SimpleNamespace
+
+    import trading_operations
+
+    results = [SimpleNamespace(volume=0.01, price=2000.5, order=11, deal=21, retcode=10009, comment='Request executed'),
+               SimpleNamespace(volume=0.02, price=1999.5, order=12, deal=22, retcode=10009, comment='a, "quoted"')]
+    for result in results:
+        trading_operations.log_order_csv(result, "XAUUSD", "BUY")
+    sync_csv_files(close=True)
+
+    with open(csv_dir / "orders.csv", newline='', encoding='utf-8') as csvfile:
+        rows = list(csv.reader(csvfile))
+    assert rows[0] == trading_operations.ORDER_CSV_FIELDNAMES
+    assert [row[1:] for row in rows[1:]] == [
+        ['XAUUSD', 'BUY', str(r.volume), str(r.price), '0', '0', str(r.order), str(r.deal), str(r.retcode), r.comment]
+        for r in results]
+
+
+def test_orders_csv_descriptor_reused_across_flushes(csv_dir):
+    """orders.csv is opened once and appended to through the same descriptor on every flush"""
+    from types import SimpleNamespace
+
+    import trading_operations
+
+    result = SimpleNamespace(volume=0.01, price=2000.5, order=1, deal=1, retcode=10009, comment='ok')
+    trading_operations.log_order_csv(result, "XAUUSD", "BUY")
+    flush_all_csv()
+    fd = logger_utils._csv_files["orders.csv"]
+    trading_operations.log_order_csv(result, "XAUUSD", "SELL")
+    flush_all_csv()
+    assert logger_utils._csv_files["orders.csv"] == fd
+    sync_csv_files(close=True)
+    assert "orders.csv" not in logger_utils._csv_files
+
+    lines = (csv_dir / "orders.csv").read_bytes().split(b"\r\n")
+    assert len(lines) == 4 and lines[-1] == b""
+
+
+def test_debug_messages_filtered_at_default_level(monkeypatch):
+    """At the default INFO level DEBUG messages are dropped before queueing and is_enabled reports it"""
+    queued = []
+    monkeypatch.setattr(logger_utils, '_writer_thread', object())
+    monkeypatch.setattr(logger_utils._log_queue, 'put_nowait', queued.append)
+    monkeypatch.setattr(logger_utils, 'LEVEL', logger_utils.INFO)
+
+    assert not logger_utils.is_enabled(logger_utils.DEBUG)
+    logger_utils.logger("per-tick detail", logger_utils.DEBUG)
+    logger_utils.logger("status")
+    assert [msg for _, msg in queued] == ["status"]
+
+    logger_utils.set_level(logger_utils.DEBUG)
+    assert logger_utils.is_enabled(logger_utils.DEBUG)
+    logger_utils.logger("per-tick detail", logger_utils.DEBUG)
+    assert [msg for _, msg in queued] == ["status", "per-tick detail"]
+
+
+def test_periodic_cleanup_collects_young_generations(monkeypatch):
+    """The periodic cleanup collects generation 1 and leaves CSV logs alone; full=True syncs and collects gen 2"""
+    generations, synced = [], []
+    monkeypatch.setattr(logger_utils.gc, 'collect', generations.append)
+    monkeypatch.setattr(logger_utils, 'sync_csv_files', lambda: synced.append(True))
+
+    logger_utils.cleanup_resources()
+    assert generations == [1] and not synced
+    logger_utils.cleanup_resources(full=True)
+    assert generations == [1, 2] and synced == [True]
@@ -0,0 +1,41 @@
+# --- Position Sizing Limits Test ---
+"""
+Verify symbol volume limits and the user's lot-size safety limits are applied in the right order
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from types import SimpleNamespace
+
+from enhanced_position_sizing import DynamicPositionSizer
+
+
+def _symbol(volume_min=0.01, volume_max=100.0, volume_step=0.01):
+    """Minimal symbol_info stand-in"""
+    return SimpleNamespace(volume_min=volume_min, volume_max=volume_max, volume_step=volume_step)
+
+
+def test_max_lot_size_wins_over_symbol_minimum():
+    """User max_lot_size caps the lot even when the broker minimum is larger"""
+    sizer = DynamicPositionSizer()
+    sizer.max_lot_size = 0.05
+    assert sizer._apply_symbol_limits(1.0, _symbol(volume_min=0.1)) == 0.05
+    assert sizer._apply_symbol_limits(0.02, _symbol(volume_min=0.1)) == 0.05
+
+
+def test_symbol_limits_within_safety_limits():
+    """Sizes are rounded to the volume step and clamped to the symbol range"""
+    sizer = DynamicPositionSizer()
+    symbol = _symbol(volume_min=0.1, volume_max=5.0, volume_step=0.1)
+    assert abs(sizer._apply_symbol_limits(0.04, symbol) - 0.1) < 1e-9
+    assert abs(sizer._apply_symbol_limits(1.26, symbol) - 1.3) < 1e-9
+    assert sizer._apply_symbol_limits(50.0, symbol) == 5.0
+
+
+def test_min_lot_size_floor():
+    """Sizes below both minimums are raised to the larger of them"""
+    sizer = DynamicPositionSizer()
+    sizer.min_lot_size = 0.02
+    assert sizer._apply_symbol_limits(0.0, _symbol(volume_min=0.01)) == 0.02
@@ -0,0 +1,85 @@
+# --- MT5 Symbol/Account Info Cache Test ---
+"""
+Verify the short TTL caches in trading_operations reuse and expire MT5 lookups
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from types import SimpleNamespace
+
+import pytest
+
+import trading_operations
+
+
+class _FakeMT5:
+    """Counts symbol_info/account_info calls and returns a new object per call"""
+
+    def __init__(self):
+        self.symbol_calls = []
+        self.account_calls = 0
+        self.missing = set()
+
+    def symbol_info(self, symbol):
+        self.symbol_calls.append(symbol)
+        return None if symbol in self.missing else SimpleNamespace(name=symbol, call=len(self.symbol_calls))
+
+    def account_info(self):
+        self.account_calls += 1
+        return SimpleNamespace(balance=1000.0, call=self.account_calls)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake MT5 module and a controllable monotonic clock"""
+    fake_time = SimpleNamespace(now=1000.0)
+    fake_time.monotonic = lambda: fake_time.now
+    mt5 = _FakeMT5()
+    monkeypatch.setattr(trading_operations, 'time', fake_time)
+    monkeypatch.setattr(trading_operations, 'mt5', mt5)
+    monkeypatch.setattr(trading_operations, '_symbol_info_cache', {})
+    monkeypatch.setattr(trading_operations, '_account_info_cache', [0.0, None])
+    fake_time.mt5 = mt5
+    return fake_time
+
+
+def test_symbol_info_reused_within_ttl(clock):
+    """Lookups inside SPEC_CACHE_TTL hit the cache; later ones query MT5 again"""
+    first = trading_operations._cached_symbol_info("XAUUSD")
+    clock.now += trading_operations.SPEC_CACHE_TTL * 0.5
+    assert trading_operations._cached_symbol_info("XAUUSD") is first
+    assert clock.mt5.symbol_calls == ["XAUUSD"]
+
+    clock.now += trading_operations.SPEC_CACHE_TTL
+    refreshed = trading_operations._cached_symbol_info("XAUUSD")
+    assert refreshed is not first
+    assert clock.mt5.symbol_calls == ["XAUUSD", "XAUUSD"]
+
+
+def test_symbol_info_cached_per_symbol(clock):
+    """Each symbol has its own entry"""
+    gold = trading_operations._cached_symbol_info("XAUUSD")
+    euro = trading_operations._cached_symbol_info("EURUSD")
+    assert gold.name == "XAUUSD" and euro.name == "EURUSD"
+    assert trading_operations._cached_symbol_info("EURUSD") is euro
+    assert clock.mt5.symbol_calls == ["XAUUSD", "EURUSD"]
+
+
+def test_missing_symbol_not_cached(clock):
+    """A None result is retried on the next call instead of being cached"""
+    clock.mt5.missing.add("BADSYM")
+    assert trading_operations._cached_symbol_info("BADSYM") is None
+    assert trading_operations._cached_symbol_info("BADSYM") is None
+    assert clock.mt5.symbol_calls == ["BADSYM", "BADSYM"]
+
+
+def test_account_info_expires(clock):
+    """Account info is reused until SPEC_CACHE_TTL has passed"""
+    first = trading_operations._cached_account_info()
+    clock.now += trading_operations.SPEC_CACHE_TTL - 0.01
+    assert trading_operations._cached_account_info() is first
+    clock.now += 0.02
+    assert trading_operations._cached_account_info() is not first
+    assert clock.mt5.account_calls == 2
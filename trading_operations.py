@@ -6,7 +6,7 @@ Core trading operations: order execution, TP/SL calculation, position management
 import datetime
 import time
 from typing import Dict, Any, Tuple, Optional, List
-from logger_utils import logger
+from logger_utils import logger, queue_csv_row
 
 # Smart MT5 connection  
 try:
@@ -16,12 +16,46 @@ except ImportError:
     import mt5_mock as mt5
     print("⚠️ Trading Operations using mock for development")
 
+# Contract specs and balance barely move between the TP, SL and order-check lookups of one trade,
+# so MT5 symbol/account info is reused for this many seconds instead of re-queried each time
+SPEC_CACHE_TTL = 1.0
+_symbol_info_cache: Dict[str, Tuple[float, Any]] = {}
+_account_info_cache: List[Any] = [0.0, None]
+
+# Column layout of csv_logs/orders.csv
+ORDER_CSV_FIELDNAMES = ['Timestamp', 'Symbol', 'Action', 'Volume', 'Price',
+                        'TP', 'SL', 'Order', 'Deal', 'Retcode', 'Comment']
+
+
+def _cached_symbol_info(symbol: str):
+    """mt5.symbol_info with a short per-symbol TTL cache"""
+    now = time.monotonic()
+    cached = _symbol_info_cache.get(symbol)
+    if cached is not None and now - cached[0] < SPEC_CACHE_TTL:
+        return cached[1]
+    info = mt5.symbol_info(symbol)
+    if info is not None:
+        _symbol_info_cache[symbol] = (now, info)
+    return info
+
+
+def _cached_account_info():
+    """mt5.account_info with a short TTL cache"""
+    now = time.monotonic()
+    fetched_at, info = _account_info_cache
+    if info is not None and now - fetched_at < SPEC_CACHE_TTL:
+        return info
+    info = mt5.account_info()
+    if info is not None:
+        _account_info_cache[:] = [now, info]
+    return info
+
 
 def calculate_pip_value(symbol: str, lot_size: float = 0.01, current_price: float = 1.0) -> float:
     """Calculate pip value for position sizing - REAL calculations"""
     try:
-        symbol_info = mt5.symbol_info(symbol)
-        account_info = mt5.account_info()
+        symbol_info = _cached_symbol_info(symbol)
+        account_info = _cached_account_info()
         
         if not symbol_info or not account_info:
             return 1.0
@@ -60,8 +94,8 @@ def calculate_tp_sl_all_modes(input_value: str, unit: str, symbol: str, order_ty
         if value == 0:
             return 0.0
 
-        symbol_info = mt5.symbol_info(symbol)
-        account_info = mt5.account_info()
+        symbol_info = _cached_symbol_info(symbol)
+        account_info = _cached_account_info()
 
         if not symbol_info:
             logger(f"❌ Cannot get symbol info for {symbol}")
@@ -245,7 +279,7 @@ def execute_trade_signal(symbol: str, action: str, lot_size: float = 0.01, tp_va
         order_type = mt5.ORDER_TYPE_BUY if action == "BUY" else mt5.ORDER_TYPE_SELL
         
         # FINAL TP/SL VALIDATION - Prevent "Invalid stops" error
-        symbol_info = mt5.symbol_info(symbol)
+        symbol_info = _cached_symbol_info(symbol)
         if symbol_info:
             stops_level = getattr(symbol_info, 'trade_stops_level', 0)
             min_distance = max(stops_level * symbol_info.point, symbol_info.point * 50)
@@ -451,44 +485,22 @@ def close_all_positions() -> int:
 def log_order_csv(order_result, symbol: str, action: str):
     """Log order to CSV file for analysis"""
     try:
-        import csv
-        import os
-        from datetime import datetime
-
-        # Ensure csv_logs directory exists
-        os.makedirs("csv_logs", exist_ok=True)
-        
-        csv_file = "csv_logs/orders.csv"
-        
-        # Check if file exists to decide on header
-        file_exists = os.path.exists(csv_file)
-        
-        with open(csv_file, 'a', newline='') as file:
-            writer = csv.writer(file)
-            
-            # Write header if file doesn't exist
-            if not file_exists:
-                writer.writerow([
-                    'Timestamp', 'Symbol', 'Action', 'Volume', 'Price', 
-                    'TP', 'SL', 'Order', 'Deal', 'Retcode', 'Comment'
-                ])
-            
-            # Write order data
-            writer.writerow([
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                symbol,
-                action,
-                getattr(order_result, 'volume', 0),
-                getattr(order_result, 'price', 0),
-                getattr(order_result, 'tp', 0),  # This might not exist in result
-                getattr(order_result, 'sl', 0),  # This might not exist in result
-                getattr(order_result, 'order', 0),
-                getattr(order_result, 'deal', 0),
-                getattr(order_result, 'retcode', 0),
-                getattr(order_result, 'comment', '')
-            ])
+        # Queued for logger_utils' CSV flusher, which appends rows to the file in batches
+        queue_csv_row("orders.csv", [
+            datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            symbol,
+            action,
+            getattr(order_result, 'volume', 0),
+            getattr(order_result, 'price', 0),
+            getattr(order_result, 'tp', 0),  # This might not exist in result
+            getattr(order_result, 'sl', 0),  # This might not exist in result
+            getattr(order_result, 'order', 0),
+            getattr(order_result, 'deal', 0),
+            getattr(order_result, 'retcode', 0),
+            getattr(order_result, 'comment', '')
+        ], ORDER_CSV_FIELDNAMES)
             
-        logger(f"📋 Order logged to CSV: {csv_file}")
+        logger(f"📋 Order logged to CSV: csv_logs/orders.csv")
         
     except Exception as e:
         logger(f"❌ Error logging to CSV: {str(e)}")